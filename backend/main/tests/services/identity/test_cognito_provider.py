@@ -14,7 +14,7 @@ class CognitoIdentityProviderTests(TestCase):
             "Attributes": [
                 {"Name": CognitoAttributeName.sub.value, "Value": "user-123"},
                 {"Name": CognitoAttributeName.email.value, "Value": "test@example.com"},
-            ]
+            ],
         }
         mock_cognito_client.return_value.list_users.return_value = [mock_user]
         mock_cognito_client.return_value.get_attr = CognitoClient.get_attr
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from main.util.cognito import (
+    CognitoAttributeName,
+    CognitoClient,
+    CognitoUserDict,
+    _cognito_client,
+)
+
+
+class CognitoClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        _cognito_client.cache_clear()
+        self.addCleanup(_cognito_client.cache_clear)
+
+        with patch("main.util.cognito.boto3.client"):
+            self.cognito = CognitoClient()
+
+    def test_client_is_shared(self) -> None:
+        """CognitoClient instances share a single boto3 client."""
+        with patch("main.util.cognito.boto3.client") as mock_boto3_client:
+            self.assertIs(CognitoClient().client, self.cognito.client)
+
+        mock_boto3_client.assert_not_called()
+
+    def test_list_users_paginates(self) -> None:
+        """Method list_users returns users from every page of the list_users paginator."""
+        paginator = MagicMock()
+        paginator.paginate.return_value = iter(
+            [
+                {
+                    "Users": [
+                        {
+                            "Username": "u1",
+                            "Attributes": [{"Name": "sub", "Value": "sub-1"}],
+                        }
+                    ]
+                },
+                {"Users": [{"Username": "u2", "Attributes": []}]},
+                {},
+            ]
+        )
+        self.cognito.client.get_paginator.return_value = paginator
+
+        users = self.cognito.list_users("pool-1")
+
+        self.cognito.client.get_paginator.assert_called_once_with("list_users")
+        paginator.paginate.assert_called_once_with(
+            UserPoolId="pool-1", PaginationConfig={"PageSize": 60}
+        )
+        self.assertEqual(
+            [user["Username"] for user in users],
+            ["u1", "u2"],
+        )
+        self.assertEqual(
+            CognitoClient.get_attr(users[0], CognitoAttributeName.sub), "sub-1"
+        )
+
+    def test_get_attr_missing(self) -> None:
+        """Method get_attr raises if the user does not have the requested attribute."""
+        user = CognitoUserDict(Username="u1", Attributes=[])
+
+        with self.assertRaises(Exception):
+            CognitoClient.get_attr(user, CognitoAttributeName.email)
@@ -0,0 +1,31 @@
+import unittest
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from main.util.io import open_source
+
+
+class OpenSourceTestCase(unittest.TestCase):
+    @patch("main.util.io.fsspec.open")
+    def test_open_source_remote(self, mock_fsspec_open: MagicMock) -> None:
+        """Function open_source reads remote sources through a readahead cache with the given block size."""
+        mock_fsspec_open.return_value = BytesIO(b"a,b\n1,2\n")
+
+        with open_source("s3://bucket/key.csv", block_size=1024) as f:
+            content = f.read()
+
+        self.assertEqual(content, b"a,b\n1,2\n")
+        mock_fsspec_open.assert_called_once_with(
+            "s3://bucket/key.csv", mode="rb", block_size=1024, cache_type="readahead"
+        )
+
+    @patch("main.util.io.fsspec.open")
+    def test_open_source_local(self, mock_fsspec_open: MagicMock) -> None:
+        """Function open_source opens local paths with fsspec defaults."""
+        mock_fsspec_open.return_value = BytesIO(b"a,b\n")
+
+        with open_source("/tmp/key.csv") as f:
+            content = f.read()
+
+        self.assertEqual(content, b"a,b\n")
+        mock_fsspec_open.assert_called_once_with("/tmp/key.csv", mode="rb")
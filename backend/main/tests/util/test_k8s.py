@@ -1,6 +1,6 @@
 import unittest
 from io import BytesIO
-from typing import cast
+from typing import Optional, cast
 from unittest.mock import MagicMock, patch
 
 from kubernetes.client.exceptions import ApiException  # type: ignore[import-untyped]
@@ -11,12 +11,15 @@ from main.util.k8s import (
     K8sJobAlreadyExists,
     K8sJobClient,
     K8sJobNotFound,
-    UnexpectedStopIteration,
+    _load_config,
 )
 
 
 class K8sJobClientTestCase(unittest.TestCase):
     def setUp(self) -> None:
+        _load_config.cache_clear()
+        self.addCleanup(_load_config.cache_clear)
+
         with (
             patch("main.util.k8s.config.load_incluster_config"),
             patch("main.util.k8s.client.BatchV1Api"),
@@ -24,6 +27,33 @@ class K8sJobClientTestCase(unittest.TestCase):
         ):
             self.k8s = K8sJobClient(namespace="test")
 
+    @patch("main.util.k8s.client.CoreV1Api")
+    @patch("main.util.k8s.client.BatchV1Api")
+    @patch("main.util.k8s.config.load_incluster_config")
+    def test_config_loaded_once(
+        self, mock_load_incluster_config: MagicMock, *_: MagicMock
+    ) -> None:
+        """K8s config is only loaded by the first K8sJobClient."""
+        _load_config.cache_clear()
+
+        K8sJobClient(namespace="test")
+        K8sJobClient(namespace="test")
+
+        mock_load_incluster_config.assert_called_once()
+
+    def test_run_job_env_order(self) -> None:
+        """Method run_job passes env vars to the container in the order given."""
+        self.k8s.batch.create_namespaced_job = MagicMock()
+
+        self.k8s.run_job("test-job", "image", env={"B": "1", "A": "$(B)"})
+
+        job = self.k8s.batch.create_namespaced_job.call_args.kwargs["body"]
+        env = job.spec.template.spec.containers[0].env
+
+        self.assertEqual(
+            [(var.name, var.value) for var in env], [("B", "1"), ("A", "$(B)")]
+        )
+
     def test_run_job_already_exists(self) -> None:
         """Method run_job throws a K8sJobAlreadyExists exception if k8s client throws a 409 ApiException with reason 'AlreadyExists'."""
         self.k8s.batch.create_namespaced_job = MagicMock(
@@ -56,38 +86,77 @@ class K8sJobClientTestCase(unittest.TestCase):
         with self.assertRaises(ApiException):
             self.k8s.run_job("test-job", "image")
 
+    def test_run_job_409_non_json_body(self) -> None:
+        """Method run_job re-raises ApiException if a 409 body is not JSON."""
+        self.k8s.batch.create_namespaced_job = MagicMock(
+            side_effect=ApiException(
+                status=409,
+                http_resp=HTTPResponse(
+                    status=409,
+                    body=BytesIO(b"<html>Conflict</html>"),
+                    preload_content=False,
+                ),
+            )
+        )
+
+        with self.assertRaises(ApiException):
+            self.k8s.run_job("test-job", "image")
+
+    def _mock_pod_list(self, pods: list[MagicMock]) -> None:
+        self.k8s.core.list_namespaced_pod = MagicMock()
+        self.k8s.core.list_namespaced_pod.return_value.items = pods
+        self.k8s.core.list_namespaced_pod.return_value.metadata.resource_version = "100"
+
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_pods_early_success(self, mock_stream: MagicMock) -> None:
-        """Method wait_for_job_pods returns a pod's PodState if list_namespaced_pod returns a pod."""
+        """Method wait_for_job_pods returns a pod's PodState if list_namespaced_pod returns a pod with expected phase."""
         pod = MagicMock()
         pod.metadata.name = "test-pod"
         pod.status.phase = "Running"
 
-        self.k8s.core.list_namespaced_pod = MagicMock()
-        self.k8s.core.list_namespaced_pod.return_value.items = [pod]
+        self._mock_pod_list([pod])
 
         pods = self.k8s.wait_for_job_pods(
             "test-job", expected_count=1, expected_pod_phases={"Running"}
         )
 
         self.assertEqual(len(pods), 1)
-        self.assertEqual(pods[0].name, pod.metadata.name)
-        self.assertEqual(pods[0].phase, pod.status.phase)
+        self.assertEqual(pods[0].name, "test-pod")
+        self.assertEqual(pods[0].phase, "Running")
+        self.assertEqual(
+            self.k8s.core.list_namespaced_pod.call_args.kwargs["field_selector"],
+            "status.phase=Running",
+        )
         mock_stream.assert_not_called()
 
+    @patch("main.util.k8s.watch.Watch.stream")
+    def test_wait_for_job_pods_multiple_phases(self, mock_stream: MagicMock) -> None:
+        """Method wait_for_job_pods asks the API server to exclude pods in phases that weren't requested."""
+        pod = {"metadata": {"name": "test-pod"}, "status": {"phase": "Succeeded"}}
+
+        self._mock_pod_list([])
+        mock_stream.return_value = [{"object": pod, "type": "ADDED"}]
+
+        self.k8s.wait_for_job_pods(
+            "test-job",
+            expected_count=1,
+            expected_pod_phases={"Running", "Succeeded", "Failed"},
+        )
+
+        self.assertEqual(
+            mock_stream.call_args.kwargs["field_selector"],
+            "status.phase!=Pending,status.phase!=Unknown",
+        )
+
     @patch("main.util.k8s.watch.Watch.stream")
     @patch("main.util.k8s.watch.Watch.stop")
     def test_wait_for_job_pods_success(
         self, mock_stop: MagicMock, mock_stream: MagicMock
     ) -> None:
         """Method wait_for_job_pods returns a pod's PodState if stream returns an event with a pod with expected phase."""
-        pod = MagicMock()
-        pod.metadata.name = "test-pod"
-        pod.status.phase = "Running"
+        pod = {"metadata": {"name": "test-pod"}, "status": {"phase": "Running"}}
 
-        self.k8s.core.list_namespaced_pod = MagicMock()
-        self.k8s.core.list_namespaced_pod.return_value.items = []
-        self.k8s.core.list_namespaced_pod.return_value.metadata.resource_version = "100"
+        self._mock_pod_list([])
         mock_stream.return_value = [{"object": pod, "type": "test-event"}]
 
         pods = self.k8s.wait_for_job_pods(
@@ -95,22 +164,17 @@ class K8sJobClientTestCase(unittest.TestCase):
         )
 
         self.assertEqual(len(pods), 1)
-        self.assertEqual(pods[0].name, pod.metadata.name)
-        self.assertEqual(pods[0].phase, pod.status.phase)
-        mock_stream.assert_called()
+        self.assertEqual(pods[0].name, pod["metadata"]["name"])
+        self.assertEqual(pods[0].phase, pod["status"]["phase"])
+        self.assertEqual(mock_stream.call_args.kwargs["resource_version"], "100")
         mock_stop.assert_called()
 
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_pods_timeout(self, mock_stream: MagicMock) -> None:
         """Method wait_for_job_pods raises TimeoutError if pods don't reach expected state within timeout."""
-        pod = MagicMock()
-        pod.metadata.name = "test-pod"
-        pod.status.phase = "SomethingElse"
-
-        self.k8s.core.list_namespaced_pod = MagicMock()
-        self.k8s.core.list_namespaced_pod.return_value.items = []
-        self.k8s.core.list_namespaced_pod.return_value.metadata.resource_version = "100"
+        pod = {"metadata": {"name": "test-pod"}, "status": {"phase": "SomethingElse"}}
 
+        self._mock_pod_list([])
         mock_stream.return_value = [{"object": pod, "type": "test-event"}]
 
         with self.assertRaises(TimeoutError):
@@ -121,15 +185,17 @@ class K8sJobClientTestCase(unittest.TestCase):
                 timeout_seconds=0,
             )
 
-    @patch("main.util.k8s.watch.Watch.stream")
-    def test_stream_pod_logs_yields_lines(self, mock_stream: MagicMock) -> None:
+    def test_stream_pod_logs_yields_lines(self) -> None:
         """Method stream_pod_logs yields log lines."""
-        mock_stream.return_value = ["line1", "line2"]
+        self.k8s.core.read_namespaced_pod_log = MagicMock()
+        self.k8s.core.read_namespaced_pod_log.return_value = BytesIO(b"line1\nline2\n")
 
-        with patch.object(self.k8s, "core"):
-            logs = list(self.k8s.stream_pod_logs("some-pod"))
+        logs = list(self.k8s.stream_pod_logs("some-pod"))
 
-        self.assertEqual(logs, mock_stream.return_value)
+        self.assertEqual(logs, ["line1", "line2"])
+        self.assertTrue(
+            self.k8s.core.read_namespaced_pod_log.call_args.kwargs["follow"]
+        )
 
     def test_get_pod_logs(self) -> None:
         """Method get_pod_logs returns logs as a single string."""
@@ -140,53 +206,107 @@ class K8sJobClientTestCase(unittest.TestCase):
 
         self.assertEqual(result, "some-logs")
 
-    def test_wait_for_job_completion_job_not_found(self) -> None:
+    def _mock_job_reads(self, *jobs: Optional[MagicMock]) -> None:
+        """Mock successive read_namespaced_job results, None meaning a 404."""
+        side_effect: list[MagicMock | ApiException] = []  # type: ignore[no-any-unimported]
+
+        for i, job in enumerate(jobs):
+            if job is None:
+                side_effect.append(ApiException(status=404))
+            else:
+                job.metadata.resource_version = str(i)
+                side_effect.append(job)
+
+        self.k8s.batch.read_namespaced_job = MagicMock(side_effect=side_effect)
+
+    @patch("main.util.k8s.watch.Watch.stream")
+    def test_wait_for_job_completion_job_not_found(
+        self, mock_stream: MagicMock
+    ) -> None:
         """Method wait_for_job_completion raises K8sJobNotFound exception if job doesn't exist."""
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = []
+        self._mock_job_reads(None)
 
         with self.assertRaises(K8sJobNotFound):
             self.k8s.wait_for_job_completion("nonexistent")
 
+        mock_stream.assert_not_called()
+
+    @patch("main.util.k8s.watch.Watch.stream")
+    def test_wait_for_job_completion_read_error(self, mock_stream: MagicMock) -> None:
+        """Method wait_for_job_completion re-raises ApiExceptions other than 404 from reading the job."""
+        self.k8s.batch.read_namespaced_job = MagicMock(
+            side_effect=ApiException(status=403)
+        )
+
+        with self.assertRaises(ApiException):
+            self.k8s.wait_for_job_completion("test-job")
+
+        mock_stream.assert_not_called()
+
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_completion_early_success(
         self, mock_stream: MagicMock
     ) -> None:
-        """Method wait_for_job_completion returns job status if list_namespaced_job returns a job with succeeded/failed status."""
+        """Method wait_for_job_completion returns job status if read_namespaced_job returns a job with succeeded/failed status."""
         job = MagicMock()
         job.status.succeeded = 1
         job.status.failed = None
-        job.metadata.name = "test-job"
 
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = [job]
+        self._mock_job_reads(job)
 
         result = self.k8s.wait_for_job_completion("test-job")
 
-        self.assertEqual(result.succeeded, job.status.succeeded)
-        self.assertEqual(result.failed, job.status.failed)
+        self.assertEqual(result.succeeded, 1)
+        self.assertEqual(result.failed, 0)
         mock_stream.assert_not_called()
 
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_completion_success(self, mock_stream: MagicMock) -> None:
         """Method wait_for_job_completion returns job status if stream returns an event with a job with succeeded/failed status."""
-        job = MagicMock()
-        job.status.succeeded = 1
-        job.status.failed = None
-        job.metadata.name = "test-job"
+        job = {"metadata": {"name": "test-job"}, "status": {"succeeded": 1}}
 
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = [MagicMock(status=None)]
-        self.k8s.batch.list_namespaced_job.return_value.metadata.resource_version = (
-            "100"
-        )
-        mock_stream.return_value = [{"object": job, "type": "test-event"}]
+        self._mock_job_reads(MagicMock(status=None))
+        mock_stream.return_value = [{"object": job, "type": "MODIFIED"}]
 
         result = self.k8s.wait_for_job_completion("test-job")
 
-        self.assertEqual(result.succeeded, job.status.succeeded)
-        self.assertEqual(result.failed, job.status.failed)
-        mock_stream.assert_called()
+        self.assertEqual(result.succeeded, 1)
+        self.assertEqual(result.failed, 0)
+        self.assertEqual(mock_stream.call_args.kwargs["resource_version"], "0")
+
+    @patch("main.util.k8s.watch.Watch.stream")
+    def test_wait_for_job_completion_restarts_watch(
+        self, mock_stream: MagicMock
+    ) -> None:
+        """Method wait_for_job_completion re-reads the job and restarts the watch if it times out or expires before the job completes."""
+        running_job = {"metadata": {"name": "test-job"}}
+        completed_job = {"metadata": {"name": "test-job"}, "status": {"failed": 1}}
+
+        self._mock_job_reads(*[MagicMock(status=None) for _ in range(3)])
+        mock_stream.side_effect = [
+            [{"object": running_job, "type": "MODIFIED"}],
+            ApiException(status=410),
+            [{"object": completed_job, "type": "MODIFIED"}],
+        ]
+
+        result = self.k8s.wait_for_job_completion("test-job")
+
+        self.assertEqual(result.succeeded, 0)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(mock_stream.call_count, 3)
+        self.assertEqual(mock_stream.call_args.kwargs["resource_version"], "2")
+        self.assertEqual(mock_stream.call_args.kwargs["timeout_seconds"], 600)
+
+    @patch("main.util.k8s.watch.Watch.stream")
+    def test_wait_for_job_completion_deleted_during_restart(
+        self, mock_stream: MagicMock
+    ) -> None:
+        """Method wait_for_job_completion raises K8sJobNotFound if the job is gone when the watch restarts."""
+        self._mock_job_reads(MagicMock(status=None), None)
+        mock_stream.return_value = []
+
+        with self.assertRaises(K8sJobNotFound):
+            self.k8s.wait_for_job_completion("test-job")
 
     def test_get_pod_container_states(self) -> None:
         """Method get_pod_container_states retrieves pod container states correctly."""
@@ -228,9 +348,8 @@ class K8sJobClientTestCase(unittest.TestCase):
 
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_deletion_early_success(self, mock_stream: MagicMock) -> None:
-        """Method wait_for_job_deletion returns early if list_namespaced_job returns an empty list."""
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = []  # Empty means it's been deleted
+        """Method wait_for_job_deletion returns early if read_namespaced_job returns 404."""
+        self._mock_job_reads(None)
 
         self.k8s.wait_for_job_deletion("test-job")
 
@@ -239,28 +358,20 @@ class K8sJobClientTestCase(unittest.TestCase):
     @patch("main.util.k8s.watch.Watch.stream")
     def test_wait_for_job_deletion_success(self, mock_stream: MagicMock) -> None:
         """Method wait_for_job_deletion returns if stream returns an deleted event for the job."""
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = [MagicMock()]
-        self.k8s.batch.list_namespaced_job.return_value.metadata.resource_version = (
-            "123"
-        )
-        mock_stream.return_value = [{"type": "DELETED", "object": MagicMock()}]
+        self._mock_job_reads(MagicMock())
+        mock_stream.return_value = [{"type": "DELETED", "object": {}}]
 
         self.k8s.wait_for_job_deletion("test-job")
 
-        mock_stream.assert_called()
+        mock_stream.assert_called_once()
 
     @patch("main.util.k8s.watch.Watch.stream")
-    def test_wait_for_job_deletion_unexpected_stop(
-        self, mock_stream: MagicMock
-    ) -> None:
-        """Method wait_for_job_deletion raises UnexpectedStopIteration if the stream ends without returning a deleted event."""
-        self.k8s.batch.list_namespaced_job = MagicMock()
-        self.k8s.batch.list_namespaced_job.return_value.items = [MagicMock()]
-        self.k8s.batch.list_namespaced_job.return_value.metadata.resource_version = (
-            "123"
-        )
-        mock_stream.return_value = [{"type": "NOT DELETED", "object": MagicMock()}]
+    def test_wait_for_job_deletion_restarts_watch(self, mock_stream: MagicMock) -> None:
+        """Method wait_for_job_deletion re-reads the job when the watch ends and returns once the job is gone."""
+        self._mock_job_reads(MagicMock(), None)
+        mock_stream.return_value = [{"type": "MODIFIED", "object": {}}]
+
+        self.k8s.wait_for_job_deletion("test-job")
 
-        with self.assertRaises(UnexpectedStopIteration):
-            self.k8s.wait_for_job_deletion("test-job")
+        mock_stream.assert_called_once()
+        self.assertEqual(self.k8s.batch.read_namespaced_job.call_count, 2)
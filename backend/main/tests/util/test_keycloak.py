@@ -0,0 +1,86 @@
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from main.util.keycloak import KeycloakClient, _get_session, _get_token_holder
+
+
+class KeycloakClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        _get_token_holder.cache_clear()
+        self.addCleanup(_get_token_holder.cache_clear)
+
+        patcher = patch.object(KeycloakClient, "_request_access_token")
+        self.mock_request_access_token = patcher.start()
+        self.mock_request_access_token.return_value = ("token", float("inf"))
+        self.addCleanup(patcher.stop)
+
+        self.keycloak = self._new_client()
+
+    @staticmethod
+    def _new_client() -> KeycloakClient:
+        return KeycloakClient(
+            server_url="http://keycloak/",
+            realm="test",
+            client_id="client",
+            client_secret="secret",
+        )
+
+    def test_token_shared_across_clients(self) -> None:
+        """KeycloakClient instances for the same realm and credentials reuse one token."""
+        self._new_client()
+
+        self.mock_request_access_token.assert_called_once()
+
+    def test_token_not_shared_across_secrets(self) -> None:
+        """KeycloakClient instances with different client secrets request their own tokens."""
+        KeycloakClient(
+            server_url="http://keycloak/",
+            realm="test",
+            client_id="client",
+            client_secret="other-secret",
+        )
+
+        self.assertEqual(self.mock_request_access_token.call_count, 2)
+
+    def test_session_shared_across_clients(self) -> None:
+        """KeycloakClient instances share one HTTP session."""
+        self.assertIs(self._new_client()._session, self.keycloak._session)
+        self.assertIs(self.keycloak._session, _get_session())
+
+    @patch("main.util.keycloak.time.monotonic")
+    def test_token_refreshed_after_expiry(self, mock_monotonic: MagicMock) -> None:
+        """KeycloakClient requests a new token once the cached one has expired."""
+        self.mock_request_access_token.return_value = ("token-2", 100.0)
+        _get_token_holder.cache_clear()
+        mock_monotonic.return_value = 0.0
+        keycloak = self._new_client()
+
+        mock_monotonic.return_value = 200.0
+        self.mock_request_access_token.return_value = ("token-3", 500.0)
+
+        self.assertEqual(keycloak._auth_header(), {"Authorization": "Bearer token-3"})
+
+    @patch.object(requests.Session, "get")
+    def test_list_users_fetches_all_pages(self, mock_get: MagicMock) -> None:
+        """Method list_users returns every page in order, including users added after counting."""
+        users = [{"id": str(i), "email": f"user{i}@example.com"} for i in range(5)]
+
+        def get(url: str, **kwargs: Any) -> MagicMock:
+            resp = MagicMock()
+
+            if url.endswith("/users/count"):
+                resp.json.return_value = 4
+            else:
+                first = kwargs["params"]["first"]
+                resp.json.return_value = users[first : first + kwargs["params"]["max"]]
+
+            return resp
+
+        mock_get.side_effect = get
+
+        result = self.keycloak.list_users(max_results=2)
+
+        self.assertEqual(result, [{"id": u["id"], "email": u["email"]} for u in users])
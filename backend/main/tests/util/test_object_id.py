@@ -0,0 +1,62 @@
+import unittest
+
+from main.util.object_id import (
+    get_id,
+    get_object_id,
+    get_uuid,
+    has_prefix,
+    remove_prefix,
+)
+
+
+class ObjectIdTestCase(unittest.TestCase):
+    def test_has_prefix(self) -> None:
+        """Function has_prefix returns the object ID prefix, including prefixes that share leading characters."""
+        self.assertEqual(has_prefix("p_1"), "p")
+        self.assertEqual(has_prefix("pr_1"), "pr")
+        self.assertEqual(has_prefix("prre_1"), "prre")
+        self.assertEqual(has_prefix("pm_1"), "pm")
+
+    def test_has_prefix_unknown(self) -> None:
+        """Function has_prefix returns None if the object ID has no known prefix."""
+        self.assertIsNone(has_prefix("x_1"))
+        self.assertIsNone(has_prefix("p1"))
+        self.assertIsNone(has_prefix("prre"))
+
+    def test_get_id(self) -> None:
+        """Function get_id strips the prefix and parses the integer ID."""
+        self.assertEqual(get_id("pm_123"), 123)
+
+        with self.assertRaises(Exception):
+            get_id("pm_abc")
+        with self.assertRaises(Exception):
+            get_id("123")
+
+    def test_get_uuid(self) -> None:
+        """Function get_uuid strips the prefix and returns the dashed v4 UUID."""
+        self.assertEqual(
+            get_uuid("p_8c9d8f5e2b5a4f0e9d1c2b3a4f5e6d7c"),
+            "8c9d8f5e-2b5a-4f0e-9d1c-2b3a4f5e6d7c",
+        )
+
+        with self.assertRaises(Exception):
+            # Version 1 UUID
+            get_uuid("p_8c9d8f5e-2b5a-1f0e-9d1c-2b3a4f5e6d7c")
+        with self.assertRaises(Exception):
+            get_uuid("p_not-a-uuid")
+        with self.assertRaises(Exception):
+            get_uuid("8c9d8f5e-2b5a-4f0e-9d1c-2b3a4f5e6d7c")
+
+    def test_get_object_id(self) -> None:
+        """Function get_object_id adds the type's prefix to int and str IDs."""
+        self.assertEqual(get_object_id(123, "PotentialMatch"), "pm_123")
+        self.assertEqual(
+            get_object_id("8c9d8f5e-2b5a-4f0e-9d1c-2b3a4f5e6d7c", "Person"),
+            "p_8c9d8f5e-2b5a-4f0e-9d1c-2b3a4f5e6d7c",
+        )
+
+    def test_remove_prefix(self) -> None:
+        """Function remove_prefix strips a known prefix and leaves other IDs unchanged."""
+        self.assertEqual(remove_prefix("prre_12"), "12")
+        self.assertEqual(remove_prefix("pr_12", "pr"), "12")
+        self.assertEqual(remove_prefix("source_123"), "source_123")
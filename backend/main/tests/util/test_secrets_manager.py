@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch
+
+from main.util.secrets_manager import SecretsManagerClient, _secrets_manager_client
+
+
+class SecretsManagerClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        _secrets_manager_client.cache_clear()
+        self.addCleanup(_secrets_manager_client.cache_clear)
+
+        with patch("main.util.secrets_manager.boto3.client"):
+            self.secrets_manager = SecretsManagerClient()
+
+    def test_client_is_shared(self) -> None:
+        """SecretsManagerClient instances share a single boto3 client."""
+        with patch("main.util.secrets_manager.boto3.client") as mock_boto3_client:
+            self.assertIs(SecretsManagerClient().client, self.secrets_manager.client)
+
+        mock_boto3_client.assert_not_called()
+
+    def test_get_secret(self) -> None:
+        """Method get_secret returns the SecretString of the secret."""
+        self.secrets_manager.client.get_secret_value.return_value = {
+            "SecretString": "value"
+        }
+
+        self.assertEqual(self.secrets_manager.get_secret("arn:secret"), "value")
+        self.secrets_manager.client.get_secret_value.assert_called_once_with(
+            SecretId="arn:secret"
+        )
@@ -0,0 +1,106 @@
+import pandas as pd
+from django.db import connection
+from django.test import TestCase
+from psycopg import sql
+
+from main.util.sql import (
+    _CopyReader,
+    create_temp_table,
+    extract_df,
+    load_data,
+    load_df,
+)
+
+
+class LoadDataTestCase(TestCase):
+    def test_load_data(self) -> None:
+        """Function load_data copies rows into the table, loading missing keys and empty strings as null."""
+        with connection.cursor() as cursor:
+            create_temp_table(
+                cursor,
+                "load_data_test",
+                [("id", "bigint", "not null"), ("name", "text", "")],
+            )
+
+            load_data(
+                cursor,
+                "load_data_test",
+                [
+                    {"id": 1, "name": "a", "extra": "ignored"},
+                    {"id": 2},
+                    {"id": "3", "name": ""},
+                ],
+                ["id", "name"],
+            )
+
+            cursor.execute("select id, name from load_data_test order by id")
+
+            self.assertEqual(cursor.fetchall(), [(1, "a"), (2, None), (3, None)])
+
+    def test_load_data_small_buffer(self) -> None:
+        """Function load_data copies every row when they span several buffers."""
+        with connection.cursor() as cursor:
+            create_temp_table(cursor, "load_data_test", [("id", "bigint", "not null")])
+
+            load_data(
+                cursor,
+                "load_data_test",
+                [{"id": i} for i in range(100)],
+                ["id"],
+                buffer_size=16,
+            )
+
+            cursor.execute("select count(*) from load_data_test")
+
+            self.assertEqual(cursor.fetchall(), [(100,)])
+
+
+class LoadDfTestCase(TestCase):
+    def test_load_df_chunks(self) -> None:
+        """Function load_df copies every row of the DataFrame when it spans several chunks."""
+        df = pd.DataFrame(
+            {"id": [1, 2, 3], "name": ["a", None, "c"], "extra": [0, 0, 0]}
+        )
+
+        with connection.cursor() as cursor:
+            create_temp_table(
+                cursor,
+                "load_df_test",
+                [("id", "bigint", "not null"), ("name", "text", "")],
+            )
+
+            loaded_count = load_df(
+                cursor, "load_df_test", df, ["id", "name"], chunk_size=2
+            )
+
+            cursor.execute("select id, name from load_df_test order by id")
+
+            self.assertEqual(loaded_count, 3)
+            self.assertEqual(cursor.fetchall(), [(1, "a"), (2, None), (3, "c")])
+
+
+class ExtractDfTestCase(TestCase):
+    def test_copy_reader(self) -> None:
+        """_CopyReader returns the concatenated chunks when reads span chunk boundaries."""
+        reader = _CopyReader([b"ab", memoryview(b""), memoryview(b"cde"), b"f"])
+        buffer = bytearray(4)
+        data = b""
+
+        while n := reader.readinto(buffer):
+            data += buffer[:n]
+
+        self.assertEqual(data, b"abcdef")
+
+    def test_extract_df(self) -> None:
+        """Function extract_df returns the query results as a DataFrame."""
+        with connection.cursor() as cursor:
+            df = extract_df(
+                cursor,
+                sql.SQL(
+                    "select i as id, 'name' || i as name from generate_series(1, 3) i"
+                ),
+                dtype={"id": "int64", "name": "string"},
+            )
+
+        self.assertEqual(df["id"].tolist(), [1, 2, 3])
+        self.assertEqual(df["name"].tolist(), ["name1", "name2", "name3"])
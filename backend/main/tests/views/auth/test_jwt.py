@@ -14,6 +14,7 @@ from main.services.identity.identity_service import JwtConfigDict
 from main.views.auth.jwt import (
     InvalidClientIdClaim,
     JwtAuthentication,
+    _get_jwks_cache,
     decode_jwt,
     extract_token_from_request,
     get_jwt_payload,
@@ -64,7 +65,7 @@ class JwtAuthenticationTests(TestCase):
         )
 
         # get_key_for_kid is memoized so we need to reset that if we regenerate the key on each test
-        get_key_for_kid.cache_clear()
+        _get_jwks_cache.cache_clear()
 
     def test_extract_token_with_bearer(self) -> None:
         """extract_token_from_request should remove Bearer and return token when header is "Authorization"."""
@@ -75,6 +76,24 @@ class JwtAuthenticationTests(TestCase):
 
         self.assertEqual(token, "abc.def.ghi")
 
+    def test_extract_token_with_lowercase_bearer(self) -> None:
+        """extract_token_from_request should accept the Bearer scheme in any case and extra spaces."""
+        request = MagicMock(spec=Request)
+        request.headers = {"Authorization": "bearer   abc.def.ghi"}
+
+        token = extract_token_from_request(request, "Authorization")
+
+        self.assertEqual(token, "abc.def.ghi")
+
+    def test_extract_token_empty_bearer(self) -> None:
+        """extract_token_from_request should return None if the Bearer token is empty."""
+        request = MagicMock(spec=Request)
+        request.headers = {"Authorization": "Bearer  "}
+
+        token = extract_token_from_request(request, "Authorization")
+
+        self.assertIsNone(token)
+
     def test_extract_token_custom_header(self) -> None:
         """extract_token_from_request should return token from headers other than "Authorization"."""
         request = MagicMock(spec=Request)
@@ -292,3 +311,49 @@ class JwtAuthenticationTests(TestCase):
         user, _ = user_tuple
 
         self.assertEqual(user, self.user)
+
+    @patch("requests.get")
+    def test_get_key_for_kid_caches_all_keys(self, mock_get: Mock) -> None:
+        """get_key_for_kid fetches the JWKS once and caches every RSA key in it."""
+        other_jwks, _ = get_jwks("kid2")
+        mock_get.return_value.json.return_value = {
+            "keys": self.jwks["keys"] + other_jwks["keys"]
+        }
+        mock_get.return_value.raise_for_status = lambda: None
+
+        get_key_for_kid(self.jwt_config["jwks_url"], "kid1")
+        get_key_for_kid(self.jwt_config["jwks_url"], "kid2")
+
+        mock_get.assert_called_once_with(self.jwt_config["jwks_url"])
+
+    @patch("requests.get")
+    def test_get_key_for_kid_refetches_after_ttl(self, mock_get: Mock) -> None:
+        """get_key_for_kid fetches the JWKS again once the cached keys expire."""
+        mock_get.return_value.json.return_value = self.jwks
+        mock_get.return_value.raise_for_status = lambda: None
+
+        get_key_for_kid(self.jwt_config["jwks_url"], "kid1")
+        _get_jwks_cache(self.jwt_config["jwks_url"]).expires_at = 0.0
+        get_key_for_kid(self.jwt_config["jwks_url"], "kid1")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_get_key_for_kid_unknown_kid(self, mock_get: Mock) -> None:
+        """get_key_for_kid raises ValueError if the JWKS has no key for the kid."""
+        mock_get.return_value.json.return_value = self.jwks
+        mock_get.return_value.raise_for_status = lambda: None
+
+        with self.assertRaises(ValueError):
+            get_key_for_kid(self.jwt_config["jwks_url"], "unknown")
+
+    def test_decode_jwt_missing_kid(self) -> None:
+        """decode_jwt raises ValueError if the token header has no kid."""
+        token = jwt.encode({"sub": "user-123"}, self.private_key_pem, algorithm="RS256")
+
+        with self.assertRaises(ValueError):
+            decode_jwt(
+                jwks_url=self.jwt_config["jwks_url"],
+                token=token,
+                audience=self.jwt_config["jwt_aud"],
+            )
@@ -5,7 +5,7 @@ from rest_framework.request import Request
 from rest_framework.views import APIView
 
 from main.models import User, UserRole
-from main.views.auth.permissions import IsAdmin, IsMember, IsMemberOrAdmin
+from main.views.auth.permissions import AnyOf, IsAdmin, IsMember, IsMemberOrAdmin
 
 
 class DummyView(APIView):
@@ -90,3 +90,20 @@ class PermissionTests(TestCase):
         request.user = User.objects.create(idp_user_id="unknown", role="other")
 
         self.assertFalse(IsMemberOrAdmin().has_permission(request, self.view))
+
+    def test_is_member_or_admin_non_user_instance(self) -> None:
+        """Tests IsMemberOrAdmin returns False if the request User is not a User instance."""
+        request = MagicMock(spec=Request)
+        request.user = "not-a-user-instance"
+
+        self.assertFalse(IsMemberOrAdmin().has_permission(request, self.view))
+
+    def test_any_of(self) -> None:
+        """Tests AnyOf returns True if any of its permissions grant access."""
+        request = MagicMock(spec=Request)
+        request.user = User.objects.create(
+            idp_user_id="admin", role=UserRole.admin.value
+        )
+
+        self.assertTrue(AnyOf(IsMember, IsAdmin).has_permission(request, self.view))
+        self.assertFalse(AnyOf(IsMember).has_permission(request, self.view))
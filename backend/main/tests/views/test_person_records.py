@@ -1,11 +1,60 @@
+import json
 from typing import Any
 from unittest.mock import patch
 
-from django.test import TestCase, override_settings
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
 from main.models import User, UserRole
 from main.services.empi.empi_service import InvalidPersonRecordFileFormat
+from main.views import person_records as person_records_views
+
+_IMPORT_REQ_OK = json.dumps(
+    {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"}
+).encode()
+_EXPORT_REQ_OK = json.dumps({"s3_uri": "s3://tuva-health-example/test"}).encode()
+
+_INVALID_S3_URI_IMPORT_BODIES = tuple(
+    json.dumps({"s3_uri": s3_uri, "config_id": "cfg_1"}).encode()
+    for s3_uri in (
+        # s3_uri missing object
+        "s3://tuva-health-example/",
+        # s3_uri bucket name has invalid character
+        "s3://tuva-health?example/test",
+        # s3_uri scheme is missing ':' character
+        "s3//tuva-health-example/test",
+        # s3_uri scheme is incorrect
+        "s4://tuva-health-example/test",
+        # s3_uri scheme is missing
+        "//tuva-health-example/test",
+        # s3_uri is HTTPS URL
+        "https://example.com",
+    )
+)
+
+_METHOD_NOT_ALLOWED = {
+    verb: {"error": {"message": f'Method "{verb}" not allowed.'}}
+    for verb in ("GET", "DELETE", "PATCH")
+}
+
+_JSON_PARSE_ERROR_BODY = {
+    "error": {
+        "message": "JSON parse error - Expecting property name enclosed in "
+        "double quotes: line 1 column 2 (char 1)"
+    }
+}
+_INVALID_CONFIG_ID_BODY = {
+    "error": {
+        "message": "Validation failed",
+        "details": [{"field": "config_id", "message": "Invalid Config ID"}],
+    }
+}
+_INVALID_S3_URI_BODY = {
+    "error": {
+        "message": "Validation failed",
+        "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
+    }
+}
 
 
 class PersonRecordsTestCase(TestCase):
@@ -18,7 +67,7 @@ class PersonRecordsTestCase(TestCase):
         auth_patcher.start()
         self.addCleanup(auth_patcher.stop)
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_validation_ok(self, mock_empi: Any) -> None:
         """Tests import_person_records request validation succeeds."""
         mock_empi_obj = mock_empi.return_value
@@ -28,13 +77,13 @@ class PersonRecordsTestCase(TestCase):
 
         response = self.client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"},
+            _IMPORT_REQ_OK,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(response.json(), {"job_id": "job_1"})
+        self.assertJSONEqual(response.content.decode(), {"job_id": "job_1"})
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_validation_invalid_content_type(self, mock_empi: Any) -> None:
         """Tests import_person_records rejects content types other than application/json."""
         mock_empi_obj = mock_empi.return_value
@@ -44,12 +93,12 @@ class PersonRecordsTestCase(TestCase):
 
         response = self.client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"},
+            _IMPORT_REQ_OK,
             content_type="application/unknown",
         )
         self.assertEqual(response.status_code, 415)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "message": 'Unsupported media type "application/unknown" in request.',
@@ -57,7 +106,7 @@ class PersonRecordsTestCase(TestCase):
             },
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_validation_invalid_request_method(self, mock_empi: Any) -> None:
         """Tests import_person_records rejects request methods besides POST."""
         mock_empi_obj = mock_empi.return_value
@@ -65,40 +114,15 @@ class PersonRecordsTestCase(TestCase):
 
         url = reverse("import_person_records")
 
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "GET" not allowed.',
-                }
-            },
-        )
-
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "DELETE" not allowed.',
-                }
-            },
-        )
-
-        response = self.client.patch(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "PATCH" not allowed.',
-                }
-            },
-        )
+        for verb in ("GET", "DELETE", "PATCH"):
+            with self.subTest(verb=verb):
+                response = getattr(self.client, verb.lower())(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[verb]
+                )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_validation_invalid_json(self, mock_empi: Any) -> None:
         """Tests import_person_records rejects request methods with invalid JSON."""
         mock_empi_obj = mock_empi.return_value
@@ -112,17 +136,12 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "JSON parse error - Expecting property name enclosed in "
-                    "double quotes: line 1 column 2 (char 1)"
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _JSON_PARSE_ERROR_BODY,
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_validation_missing_fields(self, mock_empi: Any) -> None:
         """Tests import_person_records rejects request methods with missing fields."""
         mock_empi_obj = mock_empi.return_value
@@ -137,8 +156,8 @@ class PersonRecordsTestCase(TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "details": [
@@ -156,8 +175,8 @@ class PersonRecordsTestCase(TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "details": [{"message": "Must provide either 's3_uri' or 'file'."}],
@@ -166,7 +185,7 @@ class PersonRecordsTestCase(TestCase):
             },
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_invalid_config_id(self, mock_empi: Any) -> None:
         """Tests import_person_records config_id validation fails."""
         mock_empi_obj = mock_empi.return_value
@@ -181,14 +200,9 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "config_id", "message": "Invalid Config ID"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_CONFIG_ID_BODY,
         )
 
         # config_id has 't' instead of number
@@ -198,14 +212,9 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "config_id", "message": "Invalid Config ID"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_CONFIG_ID_BODY,
         )
 
         # config_id has 'job' prefix
@@ -215,14 +224,9 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "config_id", "message": "Invalid Config ID"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_CONFIG_ID_BODY,
         )
 
         # config_id (int) is missing prefix
@@ -232,14 +236,9 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "config_id", "message": "Invalid Config ID"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_CONFIG_ID_BODY,
         )
 
         # config_id (str) is missing prefix
@@ -249,17 +248,12 @@ class PersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "config_id", "message": "Invalid Config ID"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_CONFIG_ID_BODY,
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_invalid_s3_uri(self, mock_empi: Any) -> None:
         """Tests import_person_records s3_uri validation fails."""
         mock_empi_obj = mock_empi.return_value
@@ -267,133 +261,16 @@ class PersonRecordsTestCase(TestCase):
 
         url = reverse("import_person_records")
 
-        # s3_uri missing object
-        response = self.client.post(
-            url,
-            {"s3_uri": "s3://tuva-health-example/", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
-
-        # s3_uri bucket name has invalid character
-        response = self.client.post(
-            url,
-            {"s3_uri": "s3://tuva-health?example/test", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
-
-        # s3_uri scheme is missing ':' character
-        response = self.client.post(
-            url,
-            {"s3_uri": "s3//tuva-health-example/test", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
+        for body in _INVALID_S3_URI_IMPORT_BODIES:
+            with self.subTest(body=body):
+                response = self.client.post(url, body, content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+                self.assertJSONEqual(
+                    response.content.decode(),
+                    _INVALID_S3_URI_BODY,
+                )
 
-        # s3_uri scheme is incorrect
-        response = self.client.post(
-            url,
-            {"s3_uri": "s4://tuva-health-example/test", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
-
-        # s3_uri scheme is missing
-        response = self.client.post(
-            url,
-            {"s3_uri": "//tuva-health-example/test", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
-
-        # s3_uri is HTTPS URL
-        response = self.client.post(
-            url,
-            {"s3_uri": "https://example.com", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
-        )
-
-    @override_settings(DEBUG=False)
-    @patch("main.views.person_records.EMPIService")
-    def test_import_unexpected_internal_error(self, mock_empi: Any) -> None:
-        """Tests import_person_records handles internal errors."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.import_person_records.side_effect = ValueError("Unexpected error")
-
-        url = reverse("import_person_records")
-
-        self.client.raise_request_exception = False
-        response = self.client.post(
-            url,
-            {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"},
-            content_type="application/json",
-        )
-        self.client.raise_request_exception = True
-
-        self.assertEqual(response.status_code, 500)
-        self.assertTrue(
-            response.json()["error"]["message"].startswith(
-                "Unexpected internal error - id="
-            )
-        )
-
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_invalid_file_format(self, mock_empi: Any) -> None:
         """Tests import_person_records handles invalid file format."""
         mock_empi_obj = mock_empi.return_value
@@ -405,12 +282,12 @@ class PersonRecordsTestCase(TestCase):
 
         response = self.client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"},
+            _IMPORT_REQ_OK,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "message": "Validation failed",
@@ -421,7 +298,7 @@ class PersonRecordsTestCase(TestCase):
             },
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_import_s3_object_not_found(self, mock_empi: Any) -> None:
         """Tests import_person_records handles invalid file format."""
         mock_empi_obj = mock_empi.return_value
@@ -433,12 +310,12 @@ class PersonRecordsTestCase(TestCase):
 
         response = self.client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test", "config_id": "cfg_1"},
+            _IMPORT_REQ_OK,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "message": "Validation failed",
@@ -458,20 +335,20 @@ class ExportPersonRecordsTestCase(TestCase):
         auth_patcher.start()
         self.addCleanup(auth_patcher.stop)
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_export_validation_ok(self, mock_empi: Any) -> None:
         """Tests export_person_records request validation succeeds."""
         url = reverse("export_person_records")
 
         response = self.client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test"},
+            _EXPORT_REQ_OK,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(response.json(), {})
+        self.assertJSONEqual(response.content.decode(), {})
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_export_validation_invalid_content_type(self, mock_empi: Any) -> None:
         """Tests export_person_records rejects content types other than application/json."""
         url = reverse("export_person_records")
@@ -481,8 +358,8 @@ class ExportPersonRecordsTestCase(TestCase):
             {"s3_uri": "s3://tuva-health-example/test"},
         )
         self.assertEqual(response.status_code, 415)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "message": 'Unsupported media type "multipart/form-data; boundary=BoUnDaRyStRiNg" in request.',
@@ -490,45 +367,20 @@ class ExportPersonRecordsTestCase(TestCase):
             },
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_export_validation_invalid_request_method(self, mock_empi: Any) -> None:
         """Tests export_person_records rejects request methods besides POST."""
         url = reverse("export_person_records")
 
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "GET" not allowed.',
-                }
-            },
-        )
+        for verb in ("GET", "DELETE", "PATCH"):
+            with self.subTest(verb=verb):
+                response = getattr(self.client, verb.lower())(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[verb]
+                )
 
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "DELETE" not allowed.',
-                }
-            },
-        )
-
-        response = self.client.patch(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": 'Method "PATCH" not allowed.',
-                }
-            },
-        )
-
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_export_validation_invalid_json(self, mock_empi: Any) -> None:
         """Tests export_person_records rejects request methods with invalid JSON."""
         url = reverse("export_person_records")
@@ -539,17 +391,12 @@ class ExportPersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "JSON parse error - Expecting property name enclosed in "
-                    "double quotes: line 1 column 2 (char 1)"
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _JSON_PARSE_ERROR_BODY,
         )
 
-    @patch("main.views.person_records.EMPIService")
+    @patch.object(person_records_views, "EMPIService")
     def test_export_invalid_s3_uri(self, mock_empi: Any) -> None:
         """Tests export_person_records s3_uri validation fails."""
         url = reverse("export_person_records")
@@ -561,14 +408,9 @@ class ExportPersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_S3_URI_BODY,
         )
 
         # s3_uri bucket name has invalid character
@@ -578,62 +420,92 @@ class ExportPersonRecordsTestCase(TestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_S3_URI_BODY,
+        )
+
+    @patch.object(person_records_views, "EMPIService")
+    def test_export_s3_upload_error(self, mock_empi: Any) -> None:
+        """Tests export_person_records handles S3 upload errors."""
+        mock_empi_obj = mock_empi.return_value
+        mock_empi_obj.export_person_records.side_effect = FileNotFoundError(
+            "Failed to upload to S3"
+        )
+
+        url = reverse("export_person_records")
+
+        response = self.client.post(
+            url,
+            _EXPORT_REQ_OK,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "error": {
                     "message": "Validation failed",
-                    "details": [{"field": "s3_uri", "message": "Invalid S3 URI"}],
+                    "details": [{"message": "Failed to upload to S3"}],
                 }
             },
         )
 
-    @override_settings(DEBUG=False)
-    @patch("main.views.person_records.EMPIService")
-    def test_export_unexpected_internal_error(self, mock_empi: Any) -> None:
-        """Tests export_person_records handles internal errors."""
+
+@override_settings(DEBUG=False)
+class PersonRecordsErrorTestCase(TestCase):
+    quiet_client: Client
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.quiet_client = Client(raise_request_exception=False)
+
+    def setUp(self) -> None:
+        user = User.objects.create(idp_user_id="1", role=UserRole.member.value)
+        auth_patcher = patch(
+            "main.views.auth.jwt.JwtAuthentication.authenticate",
+            return_value=(user, None),
+        )
+        auth_patcher.start()
+        self.addCleanup(auth_patcher.stop)
+
+    @patch.object(person_records_views, "EMPIService")
+    def test_import_unexpected_internal_error(self, mock_empi: Any) -> None:
+        """Tests import_person_records handles internal errors."""
         mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.export_person_records.side_effect = ValueError("Unexpected error")
+        mock_empi_obj.import_person_records.side_effect = ValueError("Unexpected error")
 
-        url = reverse("export_person_records")
+        url = reverse("import_person_records")
 
-        self.client.raise_request_exception = False
-        response = self.client.post(
+        response = self.quiet_client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test"},
+            _IMPORT_REQ_OK,
             content_type="application/json",
         )
-        self.client.raise_request_exception = True
 
         self.assertEqual(response.status_code, 500)
+        body = response.json()
         self.assertTrue(
-            response.json()["error"]["message"].startswith(
-                "Unexpected internal error - id="
-            )
+            body["error"]["message"].startswith("Unexpected internal error")
         )
 
-    @patch("main.views.person_records.EMPIService")
-    def test_export_s3_upload_error(self, mock_empi: Any) -> None:
-        """Tests export_person_records handles S3 upload errors."""
+    @patch.object(person_records_views, "EMPIService")
+    def test_export_unexpected_internal_error(self, mock_empi: Any) -> None:
+        """Tests export_person_records handles internal errors."""
         mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.export_person_records.side_effect = FileNotFoundError(
-            "Failed to upload to S3"
-        )
+        mock_empi_obj.export_person_records.side_effect = ValueError("Unexpected error")
 
         url = reverse("export_person_records")
 
-        response = self.client.post(
+        response = self.quiet_client.post(
             url,
-            {"s3_uri": "s3://tuva-health-example/test"},
+            _EXPORT_REQ_OK,
             content_type="application/json",
         )
-        self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [{"message": "Failed to upload to S3"}],
-                }
-            },
+
+        self.assertEqual(response.status_code, 500)
+        body = response.json()
+        self.assertTrue(
+            body["error"]["message"].startswith("Unexpected internal error")
         )
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any, Mapping
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import Client, TestCase
 from django.urls import reverse
 
 from main.models import Person, User, UserRole
@@ -13,9 +13,121 @@ from main.services.empi.empi_service import (
     PersonSummaryDict,
 )
 from main.util.dict import select_keys
+from main.views import persons as persons_views
+
+_GET_PERSONS_QUERY_PARAMS = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "birth_date": "1990-01-01",
+    "person_id": "p_123",
+    "source_person_id": "source_123",
+    "data_source": "test_source",
+}
+
+_SINGLE_PAGE_PAGINATION = {
+    "page": 1,
+    "page_size": 50,
+    "total_count": 1,
+    "total_pages": 1,
+    "has_next": False,
+    "has_previous": False,
+    "next_page": None,
+    "previous_page": None,
+}
+_EMPTY_PAGINATION = {
+    "page": 1,
+    "page_size": 50,
+    "total_count": 0,
+    "total_pages": 0,
+    "has_next": False,
+    "has_previous": False,
+    "next_page": None,
+    "previous_page": None,
+}
+
+_METHOD_NOT_ALLOWED = {
+    verb: {"error": {"message": f'Method "{verb}" not allowed.'}}
+    for verb in ("POST", "PUT", "DELETE")
+}
+
+_NOT_FOUND_BODY = {"error": {"message": "Resource not found"}}
+_INVALID_PERSON_ID_BODY = {
+    "error": {
+        "message": "Validation failed",
+        "details": [{"field": "person_id", "message": "Invalid Person ID"}],
+    }
+}
+
+_PERSON_ID_STR = str(uuid.UUID("5b0f2c3e-8a1d-4c6b-9e2f-7d3a1b4c5e6f"))
+_FIXED_NOW = datetime(2024, 1, 1)
+
+
+def _make_person_record() -> PersonRecordDict:
+    return {
+        "id": 1,
+        "created": _FIXED_NOW,
+        "person_uuid": _PERSON_ID_STR,
+        "person_updated": _FIXED_NOW,
+        "matched_or_reviewed": False,
+        "data_source": "ds1",
+        "source_person_id": "spid_1",
+        "first_name": "test-fn",
+        "last_name": "test-ln",
+        "sex": "f",
+        "race": "x",
+        "birth_date": "now",
+        "death_date": "later",
+        "social_security_number": "1111",
+        "address": "111 Address Way",
+        "city": "Test City",
+        "state": "AA",
+        "zip_code": "11111",
+        "county": "Test County",
+        "phone": "111-1111",
+    }
+
+
+def _make_person() -> PersonDict:
+    return {
+        "uuid": _PERSON_ID_STR,
+        "created": _FIXED_NOW,
+        "version": 1,
+        "records": [_make_person_record()],
+    }
 
 
 class PersonsTestCase(TestCase):
+    quiet_client: Client
+    PERSON_RECORD_KEYS_EXPECTED: set[str]
+    PERSON_URL: str
+    EXPECTED_GET_PERSON_BODY: dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.quiet_client = Client(raise_request_exception=False)
+
+        person = _make_person()
+        person_record = person["records"][0]
+        cls.PERSON_RECORD_KEYS_EXPECTED = person_record.keys() - {"person_uuid"}
+        cls.PERSON_URL = reverse("get_person", args=["p_" + _PERSON_ID_STR])
+        cls.EXPECTED_GET_PERSON_BODY = {
+            "person": {
+                "id": "p_" + _PERSON_ID_STR,
+                "created": person["created"].isoformat(),
+                "version": 1,
+                "records": [
+                    {
+                        **select_keys(person_record, cls.PERSON_RECORD_KEYS_EXPECTED),
+                        "id": "pr_1",
+                        "created": person_record["created"].isoformat(),
+                        "person_id": "p_" + _PERSON_ID_STR,
+                        "person_updated": person_record["person_updated"].isoformat(),
+                    }
+                ],
+            }
+        }
+
     def setUp(self) -> None:
         self.maxDiff = None
 
@@ -31,7 +143,7 @@ class PersonsTestCase(TestCase):
     # get_persons
     #
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_persons_ok_all_params(self, mock_empi: Any) -> None:
         """Tests get_persons succeeds (all query params)."""
         persons: list[PersonSummaryDict] = [
@@ -46,22 +158,14 @@ class PersonsTestCase(TestCase):
         mock_empi_obj.get_persons.return_value = persons
 
         url = reverse("get_persons")
-        query_params = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "birth_date": "1990-01-01",
-            "person_id": "p_123",
-            "source_person_id": "source_123",
-            "data_source": "test_source",
-        }
-        response = self.client.get(url, query_params)
+        response = self.client.get(url, _GET_PERSONS_QUERY_PARAMS)
 
         mock_empi_obj.get_persons.assert_called_once_with(
-            **{**query_params, "person_id": "123"}
+            **{**_GET_PERSONS_QUERY_PARAMS, "person_id": "123"}
         )
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "persons": [
                     {
@@ -71,20 +175,11 @@ class PersonsTestCase(TestCase):
                         "id": "p_" + persons[0]["uuid"],
                     }
                 ],
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 1,
-                    "total_pages": 1,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
+                "pagination": _SINGLE_PAGE_PAGINATION,
             },
         )
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_persons_ok_no_params(self, mock_empi: Any) -> None:
         """Tests get_persons succeeds (no query params)."""
         persons: list[PersonSummaryDict] = [
@@ -104,8 +199,8 @@ class PersonsTestCase(TestCase):
 
         mock_empi_obj.get_persons.assert_called_once_with(**query_params)
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "persons": [
                     {
@@ -115,20 +210,11 @@ class PersonsTestCase(TestCase):
                         "id": "p_" + persons[0]["uuid"],
                     }
                 ],
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 1,
-                    "total_pages": 1,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
+                "pagination": _SINGLE_PAGE_PAGINATION,
             },
         )
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_persons_ok_no_results(self, mock_empi: Any) -> None:
         """Tests get_persons succeeds (no persons)."""
         persons: list[PersonSummaryDict] = []
@@ -139,20 +225,11 @@ class PersonsTestCase(TestCase):
         response = self.client.get(url, {})
 
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(
-            response.json(),
+        self.assertJSONEqual(
+            response.content.decode(),
             {
                 "persons": persons,
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 0,
-                    "total_pages": 0,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
+                "pagination": _EMPTY_PAGINATION,
             },
         )
 
@@ -160,26 +237,13 @@ class PersonsTestCase(TestCase):
         """Tests get_persons rejects request methods besides GET."""
         url = reverse("get_persons")
 
-        response = self.client.post(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "POST" not allowed.'}},
-        )
-
-        response = self.client.put(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "PUT" not allowed.'}},
-        )
-
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "DELETE" not allowed.'}},
-        )
+        for verb in ("POST", "PUT", "DELETE"):
+            with self.subTest(verb=verb):
+                response = getattr(self.client, verb.lower())(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[verb]
+                )
 
     def test_get_persons_invalid_query_params(self) -> None:
         """Tests get_persons rejects invalid query parameters."""
@@ -189,94 +253,39 @@ class PersonsTestCase(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("error", response.json())
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_persons_internal_error(self, mock_empi: Any) -> None:
         """Tests get_persons handles unexpected internal errors."""
         mock_empi_obj = mock_empi.return_value
         mock_empi_obj.get_persons.side_effect = Exception("Unexpected error")
 
         url = reverse("get_persons")
-        self.client.raise_request_exception = False
-        response = self.client.get(url, {})
-        self.client.raise_request_exception = True
+        response = self.quiet_client.get(url, {})
 
         self.assertEqual(response.status_code, 500)
-        self.assertIn("error", response.json())
+        body = response.json()
         self.assertTrue(
-            response.json()["error"]["message"].startswith("Unexpected internal error")
+            body["error"]["message"].startswith("Unexpected internal error")
         )
 
     #
     # get_person
     #
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_person_ok(self, mock_empi: Any) -> None:
         """Tests get_person succeeds."""
-        person_id = uuid.uuid4()
-        person_record: PersonRecordDict = {
-            "id": 1,
-            "created": datetime.now(),
-            "person_uuid": str(person_id),
-            "person_updated": datetime.now(),
-            "matched_or_reviewed": False,
-            "data_source": "ds1",
-            "source_person_id": "spid_1",
-            "first_name": "test-fn",
-            "last_name": "test-ln",
-            "sex": "f",
-            "race": "x",
-            "birth_date": "now",
-            "death_date": "later",
-            "social_security_number": "1111",
-            "address": "111 Address Way",
-            "city": "Test City",
-            "state": "AA",
-            "zip_code": "11111",
-            "county": "Test County",
-            "phone": "111-1111",
-        }
-        person: PersonDict = {
-            "uuid": str(person_id),
-            "created": datetime.now(),
-            "version": 1,
-            "records": [person_record],
-        }
         mock_empi_obj = mock_empi.return_value
+        person = _make_person()
         mock_empi_obj.get_person.return_value = person
 
-        url = reverse("get_person", args=["p_" + str(person_id)])
-
-        response = self.client.get(url)
+        response = self.client.get(self.PERSON_URL)
 
-        mock_empi_obj.get_person.assert_called_once_with(uuid=str(person_id))
+        mock_empi_obj.get_person.assert_called_once_with(uuid=person["uuid"])
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "person": {
-                    "id": "p_" + str(person_id),
-                    "created": person["created"].isoformat(),
-                    "version": 1,
-                    "records": [
-                        {
-                            **select_keys(
-                                person_record,
-                                person_record.keys() - {"person_uuid"},
-                            ),
-                            "id": "pr_1",
-                            "created": person_record["created"].isoformat(),
-                            "person_id": "p_" + str(person_id),
-                            "person_updated": person_record[
-                                "person_updated"
-                            ].isoformat(),
-                        }
-                    ],
-                }
-            },
-        )
+        self.assertJSONEqual(response.content.decode(), self.EXPECTED_GET_PERSON_BODY)
 
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_person_not_found(self, mock_empi: Any) -> None:
         """Tests get_person returns 404 when person does not exist."""
         mock_empi_obj = mock_empi.return_value
@@ -289,9 +298,9 @@ class PersonsTestCase(TestCase):
 
         mock_empi_obj.get_person.assert_called_once_with(uuid=str(person_id))
         self.assertEqual(response.status_code, 404)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": "Resource not found"}},
+        self.assertJSONEqual(
+            response.content.decode(),
+            _NOT_FOUND_BODY,
         )
 
     def test_get_person_invalid_id(self) -> None:
@@ -301,19 +310,9 @@ class PersonsTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [
-                        {
-                            "field": "person_id",
-                            "message": "Invalid Person ID",
-                        }
-                    ],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_PERSON_ID_BODY,
         )
 
         person_id = uuid.uuid4()
@@ -321,19 +320,9 @@ class PersonsTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [
-                        {
-                            "field": "person_id",
-                            "message": "Invalid Person ID",
-                        }
-                    ],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(),
+            _INVALID_PERSON_ID_BODY,
         )
 
     def test_get_person_invalid_request_method(self) -> None:
@@ -341,28 +330,15 @@ class PersonsTestCase(TestCase):
         person_id = uuid.uuid4()
         url = reverse("get_person", args=["p_" + str(person_id)])
 
-        response = self.client.post(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "POST" not allowed.'}},
-        )
-
-        response = self.client.put(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "PUT" not allowed.'}},
-        )
+        for verb in ("POST", "PUT", "DELETE"):
+            with self.subTest(verb=verb):
+                response = getattr(self.client, verb.lower())(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[verb]
+                )
 
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "DELETE" not allowed.'}},
-        )
-
-    @patch("main.views.persons.EMPIService")
+    @patch.object(persons_views, "EMPIService")
     def test_get_person_internal_error(self, mock_empi: Any) -> None:
         """Tests get_person handles unexpected internal errors."""
         mock_empi_obj = mock_empi.return_value
@@ -371,13 +347,11 @@ class PersonsTestCase(TestCase):
         person_id = uuid.uuid4()
         url = reverse("get_person", args=["p_" + str(person_id)])
 
-        self.client.raise_request_exception = False
-        response = self.client.get(url)
-        self.client.raise_request_exception = True
+        response = self.quiet_client.get(url)
 
         mock_empi_obj.get_person.assert_called_once_with(uuid=str(person_id))
         self.assertEqual(response.status_code, 500)
-        self.assertIn("error", response.json())
+        body = response.json()
         self.assertTrue(
-            response.json()["error"]["message"].startswith("Unexpected internal error")
+            body["error"]["message"].startswith("Unexpected internal error")
         )
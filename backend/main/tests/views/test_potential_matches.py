@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Mapping
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import Client, SimpleTestCase
 from django.urls import reverse
 
 from main.models import MatchGroup, User, UserRole
@@ -14,118 +14,222 @@ from main.services.empi.empi_service import (
     PotentialMatchSummaryDict,
     PredictionResultDict,
 )
-from main.util.dict import select_keys
 
-
-class PotentialMatchesTestCase(TestCase):
-    def setUp(self) -> None:
-        self.maxDiff = None
-
-        user = User.objects.create(idp_user_id="1", role=UserRole.member.value)
+_GET_POTENTIAL_MATCHES_QUERY_PARAMS = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "birth_date": "1990-01-01",
+    "person_id": "p_123",
+    "source_person_id": "source_123",
+    "data_source": "test_source",
+}
+_POTENTIAL_MATCH_SUMMARIES: list[PotentialMatchSummaryDict] = [
+    {
+        "id": 1,
+        "first_name": "John",
+        "last_name": "Doe",
+        "data_sources": ["ds1", "ds2"],
+        "max_match_probability": 0.85,
+    }
+]
+_EXPECTED_POTENTIAL_MATCH_SUMMARY = {**_POTENTIAL_MATCH_SUMMARIES[0], "id": "pm_1"}
+
+_SINGLE_PAGE_PAGINATION = {
+    "page": 1,
+    "page_size": 50,
+    "total_count": 1,
+    "total_pages": 1,
+    "has_next": False,
+    "has_previous": False,
+    "next_page": None,
+    "previous_page": None,
+}
+_EMPTY_PAGINATION = {
+    "page": 1,
+    "page_size": 50,
+    "total_count": 0,
+    "total_pages": 0,
+    "has_next": False,
+    "has_previous": False,
+    "next_page": None,
+    "previous_page": None,
+}
+_EXPECTED_POTENTIAL_MATCHES_BODY = {
+    "potential_matches": [_EXPECTED_POTENTIAL_MATCH_SUMMARY],
+    "pagination": _SINGLE_PAGE_PAGINATION,
+}
+
+_METHOD_NOT_ALLOWED = {
+    method: {"error": {"message": f'Method "{method.upper()}" not allowed.'}}
+    for method in ("post", "put", "delete")
+}
+_NOT_FOUND_BODY = {"error": {"message": "Resource not found"}}
+_INVALID_POTENTIAL_MATCH_ID_BODY = {
+    "error": {
+        "message": "Validation failed",
+        "details": [
+            {"field": "potential_match_id", "message": "Invalid PotentialMatch ID"}
+        ],
+    }
+}
+
+_FIXTURE_PERSON_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+_FIXTURE_NOW = datetime(2024, 1, 1)
+
+_PERSON_RECORD: PersonRecordDict = {
+    "id": 1,
+    "created": _FIXTURE_NOW,
+    "person_uuid": str(_FIXTURE_PERSON_ID),
+    "person_updated": _FIXTURE_NOW,
+    "matched_or_reviewed": False,
+    "data_source": "ds1",
+    "source_person_id": "spid_1",
+    "first_name": "test-fn",
+    "last_name": "test-ln",
+    "sex": "f",
+    "race": "x",
+    "birth_date": "now",
+    "death_date": "later",
+    "social_security_number": "1111",
+    "address": "111 Address Way",
+    "city": "Test City",
+    "state": "AA",
+    "zip_code": "11111",
+    "county": "Test County",
+    "phone": "111-1111",
+}
+_PERSON: PersonDict = {
+    "uuid": str(_FIXTURE_PERSON_ID),
+    "created": _FIXTURE_NOW,
+    "version": 1,
+    "records": [_PERSON_RECORD],
+}
+_PREDICT_RESULT: PredictionResultDict = {
+    "id": 1,
+    "created": _FIXTURE_NOW,
+    "match_probability": 0.95,
+    "person_record_l_id": 1,
+    "person_record_r_id": 2,
+}
+_POTENTIAL_MATCH: PotentialMatchDict = {
+    "id": 1,
+    "created": _FIXTURE_NOW,
+    "version": 1,
+    "persons": [_PERSON],
+    "results": [_PREDICT_RESULT],
+}
+_PERSON_RECORD_SERIALIZED = {
+    **{k: v for k, v in _PERSON_RECORD.items() if k != "person_uuid"},
+    "id": "pr_1",
+    "created": _PERSON_RECORD["created"].isoformat(),
+    "person_id": "p_" + str(_FIXTURE_PERSON_ID),
+    "person_updated": _PERSON_RECORD["person_updated"].isoformat(),
+}
+_EXPECTED_POTENTIAL_MATCH_BODY = {
+    "potential_match": {
+        **_POTENTIAL_MATCH,
+        "id": "pm_1",
+        "created": _POTENTIAL_MATCH["created"].isoformat(),
+        "persons": [
+            {
+                "id": "p_" + str(_PERSON["uuid"]),
+                "created": _PERSON["created"].isoformat(),
+                "version": 1,
+                "records": [_PERSON_RECORD_SERIALIZED],
+            }
+        ],
+        "results": [
+            {
+                **_PREDICT_RESULT,
+                "id": "prre_1",
+                "created": _PREDICT_RESULT["created"].isoformat(),
+                "person_record_l_id": "pr_1",
+                "person_record_r_id": "pr_2",
+            }
+        ],
+    }
+}
+
+
+class PotentialMatchesTestCase(SimpleTestCase):
+    quiet_client: Client
+    user: User
+    list_url: str
+    detail_url_tpl: str
+    export_url: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.quiet_client = Client(raise_request_exception=False)
+
+        cls.list_url = reverse("get_potential_matches")
+        cls.detail_url_tpl = reverse("get_potential_match", args=["__ID__"])
+        cls.export_url = reverse("export_potential_matches")
+
+        # All persistence goes through the mocked EMPIService, so an unsaved
+        # user is enough to satisfy the permission checks without a database
+        cls.user = User(idp_user_id="1", role=UserRole.member.value)
         auth_patcher = patch(
             "main.views.auth.jwt.JwtAuthentication.authenticate",
-            return_value=(user, None),
+            return_value=(cls.user, None),
         )
         auth_patcher.start()
-        self.addCleanup(auth_patcher.stop)
+        cls.addClassCleanup(auth_patcher.stop)
+
+    def setUp(self) -> None:
+        self.maxDiff = None
+
+        empi_patcher = patch("main.views.potential_matches.EMPIService")
+        self.mock_empi = empi_patcher.start()
+        self.addCleanup(empi_patcher.stop)
+        self.mock_empi_obj = self.mock_empi.return_value
 
     #
     # get_potential_matches
     #
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_matches_ok_all_params(self, mock_empi: Any) -> None:
+    def test_get_potential_matches_ok_all_params(self) -> None:
         """Tests get_potential_matches succeeds (all query params)."""
-        potential_matches = [
-            {
-                "id": 1,
-                "first_name": "John",
-                "last_name": "Doe",
-                "data_sources": ["ds1", "ds2"],
-                "max_match_probability": 0.85,
-            }
-        ]
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_matches.return_value = potential_matches
-
-        url = reverse("get_potential_matches")
-        query_params = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "birth_date": "1990-01-01",
-            "person_id": "p_123",
-            "source_person_id": "source_123",
-            "data_source": "test_source",
-        }
-        response = self.client.get(url, query_params)
+        self.mock_empi_obj.get_potential_matches.return_value = (
+            _POTENTIAL_MATCH_SUMMARIES
+        )
+
+        url = self.list_url
+        response = self.client.get(url, _GET_POTENTIAL_MATCHES_QUERY_PARAMS)
 
-        mock_empi_obj.get_potential_matches.assert_called_once_with(
-            **{**query_params, "person_id": "123"}
+        self.mock_empi_obj.get_potential_matches.assert_called_once_with(
+            **{**_GET_POTENTIAL_MATCHES_QUERY_PARAMS, "person_id": "123"}
         )
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(
             response.json(),
-            {
-                "potential_matches": [{**potential_matches[0], "id": "pm_1"}],
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 1,
-                    "total_pages": 1,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
-            },
+            _EXPECTED_POTENTIAL_MATCHES_BODY,
         )
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_matches_ok_no_params(self, mock_empi: Any) -> None:
+    def test_get_potential_matches_ok_no_params(self) -> None:
         """Tests get_potential_matches succeeds (no query params)."""
-        potential_matches = [
-            {
-                "id": 1,
-                "first_name": "John",
-                "last_name": "Doe",
-                "data_sources": ["ds1", "ds2"],
-                "max_match_probability": 0.75,
-            }
-        ]
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_matches.return_value = potential_matches
+        self.mock_empi_obj.get_potential_matches.return_value = (
+            _POTENTIAL_MATCH_SUMMARIES
+        )
 
-        url = reverse("get_potential_matches")
+        url = self.list_url
         query_params: Mapping[str, str] = {}
         response = self.client.get(url, query_params)
 
-        mock_empi_obj.get_potential_matches.assert_called_once_with(**query_params)
+        self.mock_empi_obj.get_potential_matches.assert_called_once_with(**query_params)
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(
             response.json(),
-            {
-                "potential_matches": [{**potential_matches[0], "id": "pm_1"}],
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 1,
-                    "total_pages": 1,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
-            },
+            _EXPECTED_POTENTIAL_MATCHES_BODY,
         )
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_matches_ok_no_results(self, mock_empi: Any) -> None:
+    def test_get_potential_matches_ok_no_results(self) -> None:
         """Tests get_potential_matches succeeds (no potential matches)."""
         potential_matches: list[PotentialMatchSummaryDict] = []
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_matches.return_value = potential_matches
+        self.mock_empi_obj.get_potential_matches.return_value = potential_matches
 
-        url = reverse("get_potential_matches")
+        url = self.list_url
         response = self.client.get(url, {})
 
         self.assertEqual(response.status_code, 200)
@@ -133,191 +237,80 @@ class PotentialMatchesTestCase(TestCase):
             response.json(),
             {
                 "potential_matches": potential_matches,
-                "pagination": {
-                    "page": 1,
-                    "page_size": 50,
-                    "total_count": 0,
-                    "total_pages": 0,
-                    "has_next": False,
-                    "has_previous": False,
-                    "next_page": None,
-                    "previous_page": None,
-                },
+                "pagination": _EMPTY_PAGINATION,
             },
         )
 
     def test_get_potential_matches_invalid_request_method(self) -> None:
         """Tests get_potential_matches rejects request methods besides GET."""
-        url = reverse("get_potential_matches")
-
-        response = self.client.post(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "POST" not allowed.'}},
-        )
-
-        response = self.client.put(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "PUT" not allowed.'}},
-        )
+        url = self.list_url
 
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "DELETE" not allowed.'}},
-        )
+        for method in ("post", "put", "delete"):
+            with self.subTest(method=method):
+                response = getattr(self.client, method)(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[method]
+                )
 
     def test_get_potential_matches_invalid_query_params(self) -> None:
         """Tests get_potential_matches rejects invalid query parameters."""
-        url = reverse("get_potential_matches")
+        url = self.list_url
         response = self.client.get(url, {"invalid_param": "test"})
 
         self.assertEqual(response.status_code, 400)
         self.assertIn("error", response.json())
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_matches_internal_error(self, mock_empi: Any) -> None:
+    def test_get_potential_matches_internal_error(self) -> None:
         """Tests get_potential_matches handles unexpected internal errors."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_matches.side_effect = Exception("Unexpected error")
+        self.mock_empi_obj.get_potential_matches.side_effect = Exception(
+            "Unexpected error"
+        )
 
-        url = reverse("get_potential_matches")
-        self.client.raise_request_exception = False
-        response = self.client.get(url, {})
-        self.client.raise_request_exception = True
+        url = self.list_url
+        response = self.quiet_client.get(url, {})
+
+        body = response.json()
 
         self.assertEqual(response.status_code, 500)
-        self.assertIn("error", response.json())
+        self.assertIn("error", body)
         self.assertTrue(
-            response.json()["error"]["message"].startswith("Unexpected internal error")
+            body["error"]["message"].startswith("Unexpected internal error")
         )
 
     #
     # get_potential_match
     #
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_match_ok(self, mock_empi: Any) -> None:
+    def test_get_potential_match_ok(self) -> None:
         """Tests get_potential_match succeeds."""
-        person_id = uuid.uuid4()
-        person_record: PersonRecordDict = {
-            "id": 1,
-            "created": datetime.now(),
-            "person_uuid": str(person_id),
-            "person_updated": datetime.now(),
-            "matched_or_reviewed": False,
-            "data_source": "ds1",
-            "source_person_id": "spid_1",
-            "first_name": "test-fn",
-            "last_name": "test-ln",
-            "sex": "f",
-            "race": "x",
-            "birth_date": "now",
-            "death_date": "later",
-            "social_security_number": "1111",
-            "address": "111 Address Way",
-            "city": "Test City",
-            "state": "AA",
-            "zip_code": "11111",
-            "county": "Test County",
-            "phone": "111-1111",
-        }
-        person: PersonDict = {
-            "uuid": str(person_id),
-            "created": datetime.now(),
-            "version": 1,
-            "records": [person_record],
-        }
-        predict_result: PredictionResultDict = {
-            "id": 1,
-            "created": datetime.now(),
-            "match_probability": 0.95,
-            "person_record_l_id": 1,
-            "person_record_r_id": 2,
-        }
-        potential_match: PotentialMatchDict = {
-            "id": 1,
-            "created": datetime.now(),
-            "version": 1,
-            "persons": [person],
-            "results": [predict_result],
-        }
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_match.return_value = potential_match
+        self.mock_empi_obj.get_potential_match.return_value = _POTENTIAL_MATCH
 
         match_id = "pm_123"
-        url = reverse("get_potential_match", args=[match_id])
+        url = self.detail_url_tpl.replace("__ID__", match_id)
 
         response = self.client.get(url, {"include_metadata": "false"})
 
-        mock_empi_obj.get_potential_match.assert_called_once_with(
+        self.mock_empi_obj.get_potential_match.assert_called_once_with(
             id=123, fields="id,first_name,last_name,data_source,social_security_number"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "potential_match": {
-                    **potential_match,
-                    "id": "pm_1",
-                    "created": potential_match["created"].isoformat(),
-                    "persons": [
-                        {
-                            "id": "p_" + str(person["uuid"]),
-                            "created": person["created"].isoformat(),
-                            "version": 1,
-                            "records": [
-                                {
-                                    **select_keys(
-                                        person_record,
-                                        person_record.keys() - {"person_uuid"},
-                                    ),
-                                    "id": "pr_1",
-                                    "created": person_record["created"].isoformat(),
-                                    "person_id": "p_" + str(person["uuid"]),
-                                    "person_updated": person_record[
-                                        "person_updated"
-                                    ].isoformat(),
-                                }
-                            ],
-                        }
-                    ],
-                    "results": [
-                        {
-                            **predict_result,
-                            "id": "prre_1",
-                            "created": predict_result["created"].isoformat(),
-                            "person_record_l_id": "pr_1",
-                            "person_record_r_id": "pr_2",
-                        }
-                    ],
-                }
-            },
-        )
+        self.assertDictEqual(response.json(), _EXPECTED_POTENTIAL_MATCH_BODY)
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_match_not_found(self, mock_empi: Any) -> None:
+    def test_get_potential_match_not_found(self) -> None:
         """Tests get_potential_match returns 404 when potential match does not exist."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_match.side_effect = MatchGroup.DoesNotExist()
+        self.mock_empi_obj.get_potential_match.side_effect = MatchGroup.DoesNotExist()
 
         match_id = "pm_456"
-        url = reverse("get_potential_match", args=[match_id])
+        url = self.detail_url_tpl.replace("__ID__", match_id)
 
         response = self.client.get(url)
 
-        mock_empi_obj.get_potential_match.assert_called_once_with(
+        self.mock_empi_obj.get_potential_match.assert_called_once_with(
             id=456, fields="id,first_name,last_name,data_source,social_security_number"
         )
         self.assertEqual(response.status_code, 404)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": "Resource not found"}},
-        )
+        self.assertJSONEqual(response.content.decode(), _NOT_FOUND_BODY)
 
     def test_get_potential_match_invalid_id(self) -> None:
         """Tests get_potential_match rejects request with invalid match ID."""
@@ -326,19 +319,8 @@ class PotentialMatchesTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [
-                        {
-                            "field": "potential_match_id",
-                            "message": "Invalid PotentialMatch ID",
-                        }
-                    ],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(), _INVALID_POTENTIAL_MATCH_ID_BODY
         )
 
         match_id = "x_789"
@@ -346,81 +328,55 @@ class PotentialMatchesTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertDictEqual(
-            response.json(),
-            {
-                "error": {
-                    "message": "Validation failed",
-                    "details": [
-                        {
-                            "field": "potential_match_id",
-                            "message": "Invalid PotentialMatch ID",
-                        }
-                    ],
-                }
-            },
+        self.assertJSONEqual(
+            response.content.decode(), _INVALID_POTENTIAL_MATCH_ID_BODY
         )
 
     def test_get_potential_match_invalid_request_method(self) -> None:
         """Tests get_potential_match rejects request methods besides GET."""
         match_id = "pm_789"
-        url = reverse("get_potential_match", args=[match_id])
-
-        response = self.client.post(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "POST" not allowed.'}},
-        )
+        url = self.detail_url_tpl.replace("__ID__", match_id)
 
-        response = self.client.put(url, {})
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "PUT" not allowed.'}},
-        )
+        for method in ("post", "put", "delete"):
+            with self.subTest(method=method):
+                response = getattr(self.client, method)(url)
+                self.assertEqual(response.status_code, 405)
+                self.assertJSONEqual(
+                    response.content.decode(), _METHOD_NOT_ALLOWED[method]
+                )
 
-        response = self.client.delete(url)
-        self.assertEqual(response.status_code, 405)
-        self.assertDictEqual(
-            response.json(),
-            {"error": {"message": 'Method "DELETE" not allowed.'}},
-        )
-
-    @patch("main.views.potential_matches.EMPIService")
-    def test_get_potential_match_internal_error(self, mock_empi: Any) -> None:
+    def test_get_potential_match_internal_error(self) -> None:
         """Tests get_potential_match handles unexpected internal errors."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.get_potential_match.side_effect = Exception("Unexpected error")
+        self.mock_empi_obj.get_potential_match.side_effect = Exception(
+            "Unexpected error"
+        )
 
         match_id = "pm_321"
-        url = reverse("get_potential_match", args=[match_id])
+        url = self.detail_url_tpl.replace("__ID__", match_id)
 
-        self.client.raise_request_exception = False
-        response = self.client.get(url)
-        self.client.raise_request_exception = True
+        response = self.quiet_client.get(url)
 
-        mock_empi_obj.get_potential_match.assert_called_once_with(
+        self.mock_empi_obj.get_potential_match.assert_called_once_with(
             id=321, fields="id,first_name,last_name,data_source,social_security_number"
         )
+        body = response.json()
+
         self.assertEqual(response.status_code, 500)
-        self.assertIn("error", response.json())
+        self.assertIn("error", body)
         self.assertTrue(
-            response.json()["error"]["message"].startswith("Unexpected internal error")
+            body["error"]["message"].startswith("Unexpected internal error")
         )
 
     #
     # export_potential_matches
     #
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_export_potential_matches_ok_s3_uri(self, mock_empi: Any) -> None:
+    def test_export_potential_matches_ok_s3_uri(self) -> None:
         """Tests export_potential_matches succeeds with S3 URI."""
-        mock_empi_obj = mock_empi.return_value
         mock_job = type("Job", (), {"id": 123, "status": "new"})()
-        mock_empi_obj.create_export_job.return_value = mock_job
+        self.mock_empi_obj.create_export_job.return_value = mock_job
 
-        url = reverse("export_potential_matches")
+        url = self.export_url
         data = {
             "s3_uri": "s3://bucket/path/file.csv",
         }
@@ -428,8 +384,8 @@ class PotentialMatchesTestCase(TestCase):
 
         # The create_export_job should be called, but we don't need to verify the exact config_id
         # since it's a default value in the view
-        mock_empi_obj.create_export_job.assert_called_once()
-        call_args = mock_empi_obj.create_export_job.call_args
+        self.mock_empi_obj.create_export_job.assert_called_once()
+        call_args = self.mock_empi_obj.create_export_job.call_args
         self.assertEqual(call_args[1]["sink_uri"], "s3://bucket/path/file.csv")
 
         self.assertEqual(response.status_code, 202)
@@ -442,17 +398,15 @@ class PotentialMatchesTestCase(TestCase):
             },
         )
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_export_potential_matches_ok_estimate(self, mock_empi: Any) -> None:
+    def test_export_potential_matches_ok_estimate(self) -> None:
         """Tests export_potential_matches succeeds with estimate only."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.estimate_export_count.return_value = 147389
+        self.mock_empi_obj.estimate_export_count.return_value = 147389
 
-        url = reverse("export_potential_matches")
+        url = self.export_url
         data = {"estimate": True}
         response = self.client.post(url, data, content_type="application/json")
 
-        mock_empi_obj.estimate_export_count.assert_called_once()
+        self.mock_empi_obj.estimate_export_count.assert_called_once()
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(
             response.json(),
@@ -462,13 +416,11 @@ class PotentialMatchesTestCase(TestCase):
             },
         )
 
-    @patch("main.views.potential_matches.EMPIService")
-    def test_export_potential_matches_s3_error(self, mock_empi: Any) -> None:
+    def test_export_potential_matches_s3_error(self) -> None:
         """Tests export_potential_matches handles S3 errors."""
-        mock_empi_obj = mock_empi.return_value
-        mock_empi_obj.create_export_job.side_effect = Exception("S3 error")
+        self.mock_empi_obj.create_export_job.side_effect = Exception("S3 error")
 
-        url = reverse("export_potential_matches")
+        url = self.export_url
         data = {"s3_uri": "s3://bucket/path/file.csv"}
         response = self.client.post(url, data, content_type="application/json")
 
@@ -477,7 +429,7 @@ class PotentialMatchesTestCase(TestCase):
 
     def test_export_potential_matches_invalid_s3_uri(self) -> None:
         """Tests export_potential_matches validates S3 URI format."""
-        url = reverse("export_potential_matches")
+        url = self.export_url
         data = {"s3_uri": "invalid-uri"}
         response = self.client.post(url, data, content_type="application/json")
 
@@ -14,7 +14,7 @@ from main.views.potential_matches import (
 )
 from main.views.users import get_users, update_user
 
-urlpatterns = [
+urlpatterns = (
     path("health-check", health_check, name="health_check"),
     path("users", get_users, name="get_users"),
     path("users/<str:id>", update_user, name="update_user"),
@@ -34,4 +34,4 @@ urlpatterns = [
     path("persons/<str:id>", get_person, name="get_person"),
     path("schema", SpectacularAPIView.as_view(), name="schema"),
     path("docs", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
-]
+)
@@ -1,12 +1,23 @@
 import logging
 from enum import Enum
-from typing import TypedDict
+from functools import lru_cache
+from typing import Any, TypedDict
 
 import boto3  # type: ignore[import-untyped]
+from botocore.config import Config  # type: ignore[import-untyped]
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
+# Keep the connection warm across list_users pages and bound retry/timeout cost
+_COGNITO_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10,
+    max_pool_connections=20,
+)
+
 
 class CognitoAttributeName(Enum):
     email = "email"
@@ -23,23 +34,34 @@ class CognitoUserDict(TypedDict):
     Attributes: list[CognitoUserAttributeDict]
 
 
+@lru_cache(maxsize=1)
+def _cognito_client() -> Any:
+    # boto3 clients are thread-safe, so one client (and its connection pool) is
+    # shared instead of reloading the service model for every CognitoClient
+    return boto3.client("cognito-idp", config=_COGNITO_CLIENT_CONFIG)
+
+
 class CognitoClient:
     def __init__(self) -> None:
-        self.client = boto3.client("cognito-idp")
+        self.client = _cognito_client()
 
     def list_users(self, user_pool_id: str) -> list[CognitoUserDict]:
         try:
             logger.info("Fetching users from Cognito")
 
-            response = self.client.list_users(
+            # Cognito returns at most 60 users per call, so follow PaginationToken
+            paginator = self.client.get_paginator("list_users")
+            pages = paginator.paginate(
                 UserPoolId=user_pool_id,
+                PaginationConfig={"PageSize": 60},
             )
 
             return [
                 CognitoUserDict(
                     Username=user["Username"], Attributes=user["Attributes"]
                 )
-                for user in response.get("Users", [])
+                for page in pages
+                for user in page.get("Users", [])
             ]
 
         except ClientError as e:
@@ -48,17 +70,20 @@ class CognitoClient:
 
     @staticmethod
     def get_attr(cognito_user: CognitoUserDict, attr_name: CognitoAttributeName) -> str:
-        sub_attrs = [
-            attr
-            for attr in cognito_user["Attributes"]
-            if attr["Name"] == attr_name.value
-        ]
-
-        # This should never happen, attributes should be unique
-        if len(sub_attrs) != 1:
+        # Stop at the first match instead of collecting every matching attribute
+        value = next(
+            (
+                attr["Value"]
+                for attr in cognito_user["Attributes"]
+                if attr["Name"] == attr_name.value
+            ),
+            None,
+        )
+
+        if value is None:
             raise Exception(
-                f"Failed to get {attr_name.value} from AWS Cognito user. Expected a single {attr_name.value} attribute",
+                f"Failed to get {attr_name.value} from AWS Cognito user. Missing {attr_name.value} attribute",
                 cognito_user,
             )
 
-        return sub_attrs[0]["Value"]
+        return value
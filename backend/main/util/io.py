@@ -2,18 +2,30 @@ import io
 from contextlib import contextmanager
 from tempfile import SpooledTemporaryFile
 from typing import IO, Iterator
-from urllib.parse import urlunparse
+from urllib.parse import urlparse, urlunparse
 
 import fsspec  # type: ignore[import-untyped]
 from django.core.files.uploadedfile import UploadedFile
 
 DEFAULT_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE
 DEFAULT_MAX_TEMP_FILE_BUFFER_SIZE = 20 * 1024 * 1024  # 20 MiB
+DEFAULT_REMOTE_BLOCK_SIZE = 32 * 1024 * 1024  # 32 MiB
+
+_REMOTE_SCHEMES = {"s3", "http", "https"}
 
 
 @contextmanager
-def open_source(source: str | UploadedFile) -> Iterator[IO[bytes]]:
-    if isinstance(source, str):
+def open_source(
+    source: str | UploadedFile, block_size: int = DEFAULT_REMOTE_BLOCK_SIZE
+) -> Iterator[IO[bytes]]:
+    if isinstance(source, str) and urlparse(source).scheme in _REMOTE_SCHEMES:
+        # Sources are read sequentially, so fetch large blocks per request. The
+        # readahead cache already buffers reads, so don't wrap it in another buffer
+        with fsspec.open(
+            source, mode="rb", block_size=block_size, cache_type="readahead"
+        ) as f:
+            yield f
+    elif isinstance(source, str):
         with fsspec.open(source, mode="rb") as f:
             yield f
     else:
@@ -1,8 +1,9 @@
+import io
 import json
 import logging
-import time
 from dataclasses import dataclass
-from typing import Generator, Literal, Optional, cast
+from functools import lru_cache
+from typing import AbstractSet, Any, Generator, Literal, Mapping, Optional, cast
 
 from kubernetes import client, config, watch  # type: ignore[import-untyped]
 from kubernetes.client import (  # type: ignore[import-untyped]
@@ -20,6 +21,9 @@ from kubernetes.config.config_exception import (  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
+JOB_WATCH_TIMEOUT_SECONDS = 600
+_POD_PHASES = ("Pending", "Running", "Succeeded", "Failed", "Unknown")
+
 
 @dataclass
 class SecretVolume:
@@ -60,8 +64,55 @@ class PodState:
     phase: Optional[str]
 
 
-class UnexpectedStopIteration(Exception):
-    """A stream (generator) stopped unexpectedly."""
+@lru_cache(maxsize=1)
+def _load_config() -> None:
+    # Sets the default client configuration, which later API clients reuse
+    try:
+        logger.info("Loading in-cluster config")
+        config.load_incluster_config()
+    except ConfigException:
+        logger.info("Failed to load in-cluster config. Loading kube config")
+        config.load_kube_config()
+
+
+@lru_cache(maxsize=1)
+def _get_current_namespace() -> str:
+    # The service account namespace is fixed for the lifetime of the pod
+    try:
+        with open("/var/run/secrets/kubernetes.io/serviceaccount/namespace", "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return "default"
+
+
+def _get_pod_phase_field_selector(pod_phases: AbstractSet[str]) -> Optional[str]:
+    """Returns a field selector that lets the API server filter pods by phase."""
+    if len(pod_phases) == 1:
+        return f"status.phase={next(iter(pod_phases))}"
+
+    excluded = sorted(set(_POD_PHASES) - pod_phases)
+
+    return ",".join(f"status.phase!={phase}" for phase in excluded) or None
+
+
+def _get_api_exception_reason(e: ApiException) -> str:  # type: ignore[no-any-unimported]
+    """Returns the reason from a K8s API error body, or "" if it isn't a JSON status."""
+    try:
+        return str(json.loads(e.body).get("reason", ""))
+    except (TypeError, ValueError, AttributeError):
+        # e.g. an HTML error page from a proxy in front of the API server
+        return ""
+
+
+class _RawWatch(watch.Watch):  # type: ignore[no-any-unimported]
+    """Watch that yields event objects as plain dicts instead of V1 models.
+
+    Only a couple of fields are read from each event, so skip deserializing every
+    event into a full V1Pod/V1Job.
+    """
+
+    def get_return_type(self, func: Any) -> None:
+        return None
 
 
 class K8sJobNotFound(Exception):
@@ -73,35 +124,23 @@ class K8sJobAlreadyExists(Exception):
 
 
 class K8sJobClient:
+    api_client: client.ApiClient  # type: ignore[no-any-unimported]
     batch: client.BatchV1Api  # type: ignore[no-any-unimported]
     core: client.CoreV1Api  # type: ignore[no-any-unimported]
     namespace: str
 
     def __init__(self, namespace: str = "default") -> None:
-        try:
-            logger.info("Loading in-cluster config")
-            config.load_incluster_config()
-        except ConfigException:
-            logger.info("Failed to load in-cluster config. Loading kube config")
-            config.load_kube_config()
+        _load_config()
 
-        self.batch = client.BatchV1Api()
-        self.core = client.CoreV1Api()
+        # Share one connection pool between the batch and core APIs
+        self.api_client = client.ApiClient()
+        self.batch = client.BatchV1Api(self.api_client)
+        self.core = client.CoreV1Api(self.api_client)
 
         if namespace is not None:
             self.namespace = namespace
         else:
-            self.namespace = self._get_current_namespace()
-
-    @staticmethod
-    def _get_current_namespace() -> str:
-        try:
-            with open(
-                "/var/run/secrets/kubernetes.io/serviceaccount/namespace", "r"
-            ) as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            return "default"
+            self.namespace = _get_current_namespace()
 
     def run_job(
         self,
@@ -114,7 +153,7 @@ class K8sJobClient:
         parallelism: int = 1,
         completions: int = 1,
         backoff_limit: int = 0,
-        env: dict[str, str] = {},
+        env: Optional[Mapping[str, str]] = None,
         service_account_name: Optional[str] = None,
     ) -> None:
         logger.info(f"Creating K8s job {job_name} in namespace {self.namespace}")
@@ -139,6 +178,13 @@ class K8sJobClient:
                 )
             )
 
+        env_vars = (
+            [client.V1EnvVar(name=key, value=value) for key, value in env.items()]
+            if env
+            else None
+        )
+
+        # Empty lists are sent as [], None fields are omitted from the request
         job = V1Job(
             metadata=V1ObjectMeta(name=job_name),
             spec=V1JobSpec(
@@ -153,14 +199,11 @@ class K8sJobClient:
                                 image=image,
                                 image_pull_policy=image_pull_policy,
                                 args=args,
-                                volume_mounts=volume_mounts,
-                                env=[
-                                    client.V1EnvVar(name=key, value=value)
-                                    for key, value in env.items()
-                                ],
+                                volume_mounts=volume_mounts or None,
+                                env=env_vars,
                             )
                         ],
-                        volumes=volumes,
+                        volumes=volumes or None,
                         service_account_name=service_account_name,
                     ),
                 ),
@@ -175,7 +218,7 @@ class K8sJobClient:
             logger.info(f"K8s job {job_name} successfully submitted")
         except ApiException as e:
             logger.error(f"Failed to submit K8s job {job_name}: {e}")
-            if e.status == 409 and json.loads(e.body)["reason"] == "AlreadyExists":
+            if e.status == 409 and _get_api_exception_reason(e) == "AlreadyExists":
                 logger.error("K8s job already exists")
                 raise K8sJobAlreadyExists("K8s job already exists") from e
             else:
@@ -207,8 +250,8 @@ class K8sJobClient:
 
         return [
             PodState(
-                cast(str, pod.metadata.name),
-                cast(str, pod.status.phase) if pod.status else None,
+                pod.metadata.name,
+                pod.status.phase if pod.status else None,
             )
             for pod in pod_list.items
         ]
@@ -239,16 +282,18 @@ class K8sJobClient:
         )
 
         label_selector = f"job-name={job_name}"
+        field_selector = _get_pod_phase_field_selector(expected_pod_phases)
         pod_states: dict[str, PodState] = {}
 
         pod_list = self.core.list_namespaced_pod(
             namespace=self.namespace,
             label_selector=label_selector,
+            field_selector=field_selector,
         )
 
         for pod in pod_list.items:
-            pod_name = cast(str, pod.metadata.name)
-            pod_phase = cast(str, pod.status.phase) if pod.status else None
+            pod_name = pod.metadata.name
+            pod_phase = pod.status.phase if pod.status else None
 
             if pod_phase in expected_pod_phases:
                 logger.info(
@@ -259,21 +304,20 @@ class K8sJobClient:
         if len(pod_states) >= expected_count:
             return list(pod_states.values())
 
-        pod_list_resource_version = pod_list.metadata.resource_version
-        start = time.time()
-        w = watch.Watch()
+        w = _RawWatch()
 
         try:
             for event in w.stream(
                 self.core.list_namespaced_pod,
                 namespace=self.namespace,
                 label_selector=label_selector,
-                resource_version=pod_list_resource_version,
+                field_selector=field_selector,
+                resource_version=pod_list.metadata.resource_version,
                 timeout_seconds=timeout_seconds,
             ):
                 pod = event["object"]
-                pod_name = cast(str, pod.metadata.name)
-                pod_phase = cast(str, pod.status.phase) if pod.status else None
+                pod_name = pod["metadata"]["name"]
+                pod_phase = (pod.get("status") or {}).get("phase")
 
                 # TODO: Should we check event type is in {added, modified}?
                 logger.debug(f"Pod {pod_name} event: {event['type']}")
@@ -287,12 +331,7 @@ class K8sJobClient:
                     if len(pod_states) >= expected_count:
                         return list(pod_states.values())
 
-                if time.time() - start > timeout_seconds:
-                    raise TimeoutError(
-                        f"Timed out waiting for K8s job {job_name} pod(s)"
-                    )
-
-            # TODO: Can stream end without throwing? If not, this might be unnecessary.
+            # The API server closes the watch once timeout_seconds has elapsed
             if len(pod_states) < expected_count:
                 raise TimeoutError(f"Timed out waiting for K8s job {job_name} pod(s)")
             else:
@@ -308,21 +347,22 @@ class K8sJobClient:
         """
         logger.info(f"Streaming logs for pod {pod_name}")
 
-        w = watch.Watch()
-
         try:
-            for line in w.stream(
-                self.core.read_namespaced_pod_log,
+            resp = self.core.read_namespaced_pod_log(
                 name=pod_name,
                 namespace=self.namespace,
                 follow=True,
                 # timestamps=True,
-            ):
-                yield line
+                _preload_content=False,
+            )
+
+            # Let the text wrapper buffer and decode the raw response instead of
+            # splitting lines in Python like Watch.stream does
+            with io.TextIOWrapper(resp, encoding="utf-8", errors="replace") as lines:
+                for line in lines:
+                    yield line.rstrip("\n")
         except Exception as e:
             logger.warning(f"Failed to stream logs for pod {pod_name}: {e}")
-        finally:
-            w.stop()
 
     def get_pod_logs(self, pod_name: str) -> str:
         """Get pod logs.
@@ -345,6 +385,44 @@ class K8sJobClient:
             ),
         )
 
+    def _read_job(self, job_name: str) -> Optional[V1Job]:  # type: ignore[no-any-unimported]
+        """Read a K8s job by name, returning None if it doesn't exist."""
+        try:
+            return self.batch.read_namespaced_job(
+                name=job_name, namespace=self.namespace
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def _stream_job_events(  # type: ignore[no-any-unimported]
+        self, w: watch.Watch, job_name: str, resource_version: str
+    ) -> Generator[dict[str, Any], None, None]:
+        """Watch a K8s job from a resource version.
+
+        The API server closes the watch after JOB_WATCH_TIMEOUT_SECONDS, so callers
+        re-read the job and start a new watch when the stream ends.
+
+        Args:
+            w: Watch used to stream events
+            job_name: Name of the job
+            resource_version: Resource version of the preceding job read
+
+        Returns:
+            Generator of watch events
+        """
+        return cast(
+            Generator[dict[str, Any], None, None],
+            w.stream(
+                self.batch.list_namespaced_job,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={job_name}",
+                resource_version=resource_version,
+                timeout_seconds=JOB_WATCH_TIMEOUT_SECONDS,
+            ),
+        )
+
     def wait_for_job_completion(
         self,
         job_name: str,
@@ -359,45 +437,42 @@ class K8sJobClient:
         """
         logger.info(f"Waiting for K8s job {job_name} to complete")
 
-        field_selector = f"metadata.name={job_name}"
-        job_list = self.batch.list_namespaced_job(
-            namespace=self.namespace,
-            field_selector=field_selector,
-        )
+        # Jobs can run for a long time, so have the API server close the watch
+        # periodically and restart it from a fresh read of the job
+        while True:
+            job = self._read_job(job_name)
 
-        if not job_list.items:
-            raise K8sJobNotFound(f"K8s job {job_name} not found")
+            if job is None:
+                raise K8sJobNotFound(f"K8s job {job_name} not found")
 
-        job = job_list.items[0]
+            if job.status and (job.status.succeeded or job.status.failed):
+                return JobCompleteStatus(
+                    succeeded=job.status.succeeded or 0,
+                    failed=job.status.failed or 0,
+                )
 
-        if job.status and (job.status.succeeded or job.status.failed):
-            return JobCompleteStatus(
-                succeeded=job.status.succeeded, failed=job.status.failed
-            )
+            w = _RawWatch()
 
-        resource_version = job_list.metadata.resource_version
-        w = watch.Watch()
+            try:
+                for event in self._stream_job_events(
+                    w, job_name, job.metadata.resource_version
+                ):
+                    logger.debug(f"K8s job {job_name} event: {event['type']}")
 
-        try:
-            for event in w.stream(
-                self.batch.list_namespaced_job,
-                namespace=self.namespace,
-                field_selector=field_selector,
-                resource_version=resource_version,
-            ):
-                job = event["object"]
-
-                logger.debug(f"K8s job {job.metadata.name} event: {event['type']}")
+                    status = event["object"].get("status") or {}
+                    succeeded = status.get("succeeded") or 0
+                    failed = status.get("failed") or 0
 
-                if job.status and (job.status.succeeded or job.status.failed):
-                    return JobCompleteStatus(
-                        succeeded=job.status.succeeded, failed=job.status.failed
-                    )
-        finally:
-            w.stop()
+                    if succeeded or failed:
+                        return JobCompleteStatus(succeeded=succeeded, failed=failed)
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                logger.info(f"K8s job {job_name} watch expired")
+            finally:
+                w.stop()
 
-        # TODO: Can stream end without throwing? This might be unnecessary.
-        raise UnexpectedStopIteration("Unexpected end of stream")
+            logger.debug(f"Restarting K8s job {job_name} watch")
 
     def get_pod_container_states(self, pod_name: str) -> list[ContainerState]:
         logger.info(f"Retrieving pod {pod_name} container states")
@@ -466,36 +541,33 @@ class K8sJobClient:
         """
         logger.info(f"Waiting for deletion of K8s job {job_name}")
 
-        field_selector = f"metadata.name={job_name}"
-        job_list = self.batch.list_namespaced_job(
-            namespace=self.namespace,
-            field_selector=field_selector,
-        )
+        # Re-read the job whenever the watch ends so a deletion that happened
+        # while the watch was down is still noticed
+        while True:
+            job = self._read_job(job_name)
 
-        if not job_list.items:
-            logger.info(f"K8s job {job_name} not found. Assuming it's been deleted")
-            return
+            if job is None:
+                logger.info(f"K8s job {job_name} not found. Assuming it's been deleted")
+                return
 
-        resource_version = job_list.metadata.resource_version
-        w = watch.Watch()
+            w = _RawWatch()
 
-        try:
-            for event in w.stream(
-                self.batch.list_namespaced_job,
-                namespace=self.namespace,
-                field_selector=field_selector,
-                resource_version=resource_version,
-            ):
-                event_type = event["type"]
-
-                logger.debug(f"K8s job {job_name} event: {event_type}")
+            try:
+                for event in self._stream_job_events(
+                    w, job_name, job.metadata.resource_version
+                ):
+                    event_type = event["type"]
 
-                if event_type == "DELETED":
-                    logger.info(f"K8s job {job_name} has been deleted")
-                    return
+                    logger.debug(f"K8s job {job_name} event: {event_type}")
 
-        finally:
-            w.stop()
+                    if event_type == "DELETED":
+                        logger.info(f"K8s job {job_name} has been deleted")
+                        return
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                logger.info(f"K8s job {job_name} watch expired")
+            finally:
+                w.stop()
 
-        # TODO: Can stream end without throwing? This might be unnecessary.
-        raise UnexpectedStopIteration("Unexpected end of stream")
+            logger.debug(f"Restarting K8s job {job_name} watch")
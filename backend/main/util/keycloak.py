@@ -1,16 +1,64 @@
+import hashlib
 import logging
-from typing import TypedDict, cast
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, TypedDict, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_PAGE_REQUESTS = 16
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
 
 class KeycloakUserDict(TypedDict):
     id: str
     email: str
 
 
+@dataclass
+class _TokenHolder:
+    token: Optional[str] = None
+    expires_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@lru_cache(maxsize=8)
+def _get_token_holder(
+    token_url: str, client_id: str, client_secret_hash: str
+) -> _TokenHolder:
+    """Returns the token shared by every client with the same realm and credentials.
+
+    The secret is part of the key so a client with a wrong or rotated secret
+    requests its own token instead of reusing another client's.
+    """
+    return _TokenHolder()
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    # A client is created per IdentityService (e.g. per request), so share one
+    # session to reuse keep-alive connections across clients
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=2 * MAX_CONCURRENT_PAGE_REQUESTS,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
 class KeycloakClient:
     base_url: str
     realm: str
@@ -19,6 +67,8 @@ class KeycloakClient:
     client_id: str
     client_secret: str
     token: str
+    _token_holder: _TokenHolder
+    _session: requests.Session
 
     def __init__(
         self,
@@ -33,15 +83,30 @@ class KeycloakClient:
         self.admin_api_url = f"{self.base_url}/admin/realms/{realm}"
         self.client_id = client_id
         self.client_secret = client_secret
+        self._token_holder = _get_token_holder(
+            self.token_url,
+            client_id,
+            hashlib.sha256(client_secret.encode("utf-8")).hexdigest(),
+        )
+        self._session = _get_session()
         self.token = self._get_access_token()
 
     def _get_access_token(self) -> str:
+        holder = self._token_holder
+
+        with holder.lock:
+            if holder.token is None or time.monotonic() >= holder.expires_at:
+                holder.token, holder.expires_at = self._request_access_token()
+
+            return holder.token
+
+    def _request_access_token(self) -> tuple[str, float]:
         logger.info(
             "Requesting Keycloak service account token using client credentials"
         )
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 self.token_url,
                 data={
                     "grant_type": "client_credentials",
@@ -51,45 +116,71 @@ class KeycloakClient:
                 timeout=10,
             )
             resp.raise_for_status()
+            body = resp.json()
+
+            # Refresh a little early so the token doesn't expire mid-request
+            expires_at = (
+                time.monotonic()
+                + float(body.get("expires_in", 0))
+                - TOKEN_EXPIRY_MARGIN_SECONDS
+            )
 
-            return cast(str, resp.json()["access_token"])
+            return cast(str, body["access_token"]), expires_at
 
         except requests.RequestException as e:
             logger.error(f"Failed to get Keycloak token: {e}")
             raise
 
+    def _auth_header(self) -> dict[str, str]:
+        self.token = self._get_access_token()
+
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def _get_user_count(self) -> int:
+        resp = self._session.get(
+            f"{self.admin_api_url}/users/count",
+            headers=self._auth_header(),
+            timeout=10,
+        )
+        resp.raise_for_status()
+
+        return int(resp.json())
+
+    def _get_users_page(self, first: int, max_results: int) -> list[KeycloakUserDict]:
+        resp = self._session.get(
+            f"{self.admin_api_url}/users",
+            headers=self._auth_header(),
+            params={"first": first, "max": max_results},
+            timeout=10,
+        )
+        resp.raise_for_status()
+
+        return [KeycloakUserDict(id=u["id"], email=u["email"]) for u in resp.json()]
+
     def list_users(self, max_results: int = 100) -> list[KeycloakUserDict]:
         logger.info("Fetching users from Keycloak")
 
-        headers = {"Authorization": f"Bearer {self.token}"}
-        users: list[KeycloakUserDict] = []
-        first = 0
-
-        while True:
-            try:
-                resp = requests.get(
-                    f"{self.admin_api_url}/users",
-                    headers=headers,
-                    params={"first": first, "max": max_results},
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                batch = resp.json()
-
-                if not batch:
-                    break
-
-                users.extend(
-                    KeycloakUserDict(
-                        id=u["id"],
-                        email=u["email"],
-                    )
-                    for u in batch
+        try:
+            # Fetch the pages covering the current user count concurrently
+            offsets = range(0, self._get_user_count(), max_results)
+
+            with ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_PAGE_REQUESTS
+            ) as executor:
+                pages = executor.map(
+                    lambda first: self._get_users_page(first, max_results), offsets
                 )
+                users = [user for page in pages for user in page]
+
+            # Pick up any users created after counting
+            first = len(offsets) * max_results
+
+            while batch := self._get_users_page(first, max_results):
+                users.extend(batch)
                 first += max_results
 
-            except requests.RequestException as e:
-                logger.error(f"Failed to fetch users: {e}")
-                raise
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch users: {e}")
+            raise
 
         return users
@@ -1,3 +1,4 @@
+import re
 import uuid
 from typing import Literal, Optional, Union
 
@@ -14,62 +15,75 @@ object_id_prefixes = {
 }
 
 
+_PREFIX_WITH_SEP = {k: v + "_" for k, v in object_id_prefixes.items()}
+
+# Longest prefixes first so e.g. "prre" is tried before "pr" and "p"
+_PREFIX_RE = re.compile(
+    "^("
+    + "|".join(
+        re.escape(p)
+        for p in sorted(set(object_id_prefixes.values()), key=len, reverse=True)
+    )
+    + ")_"
+)
+
+
 def get_prefix(object_type: str) -> str:
     return object_id_prefixes[object_type]
 
 
-def has_prefix(object_id: str) -> Optional[str]:
-    prefix = None
+def _split_object_id(object_id: str) -> Optional[tuple[str, str]]:
+    """Split an object ID into its prefix and the ID after the separator."""
+    m = _PREFIX_RE.match(object_id)
 
-    for pre in object_id_prefixes.values():
-        if object_id.startswith(pre + "_"):
-            prefix = pre
+    return (m.group(1), object_id[m.end() :]) if m else None
 
-    return prefix
 
+def has_prefix(object_id: str) -> Optional[str]:
+    split = _split_object_id(object_id)
+
+    return split[0] if split else None
 
-def remove_prefix(object_id: str, prefix: Optional[str] = None) -> str:
-    if not prefix:
-        prefix = has_prefix(object_id)
 
+def remove_prefix(object_id: str, prefix: Optional[str] = None) -> str:
     if prefix:
         return object_id.removeprefix(prefix + "_")
-    else:
-        return object_id
+
+    split = _split_object_id(object_id)
+
+    return split[1] if split else object_id
 
 
 def get_id(object_id: str) -> int:
     """Remove prefix from object ID and cast to int."""
-    prefix = has_prefix(object_id)
+    split = _split_object_id(object_id)
 
-    if not prefix:
+    if not split:
         raise Exception("Invalid object ID: unknown object prefix")
 
-    id = remove_prefix(object_id, prefix)
-
     try:
-        return int(id)
+        return int(split[1])
     except Exception:
         raise Exception("Invalid object ID: unknown ID format")
 
 
 def get_uuid(object_id: str) -> str:
     """Remove prefix from object ID."""
-    prefix = has_prefix(object_id)
+    split = _split_object_id(object_id)
 
-    if not prefix:
+    if not split:
         raise Exception("Invalid object ID: unknown object prefix")
 
-    id = remove_prefix(object_id, prefix)
-
     try:
-        if not (uuid.UUID(id).version == 4):
-            raise Exception("Invalid object ID: unknown ID format")
+        id = uuid.UUID(split[1])
     except Exception:
         raise Exception("Invalid object ID: unknown ID format")
 
+    if id.version != 4:
+        raise Exception("Invalid object ID: unknown ID format")
+
     # Ensure UUID is formatted with dashes
-    return str(uuid.UUID(id))
+    return str(id)
 
 
 def is_object_id(object_id: str, type: Literal["int", "uuid"]) -> bool:
@@ -86,4 +100,4 @@ def is_object_id(object_id: str, type: Literal["int", "uuid"]) -> bool:
 
 def get_object_id(id: Union[int, str], type: str) -> str:
     """Add object ID prefix to ID."""
-    return object_id_prefixes[type] + "_" + str(id)
+    return _PREFIX_WITH_SEP[type] + (id if isinstance(id, str) else str(id))
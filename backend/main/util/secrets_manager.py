@@ -1,5 +1,6 @@
 import logging
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
 import boto3  # type: ignore[import-untyped]
 import boto3.exceptions  # type: ignore[import-untyped]
@@ -7,9 +8,16 @@ import boto3.exceptions  # type: ignore[import-untyped]
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _secrets_manager_client() -> Any:
+    # Share one boto3 client instead of reloading the service model and
+    # resolving credentials for every SecretsManagerClient
+    return boto3.client("secretsmanager")
+
+
 class SecretsManagerClient:
     def __init__(self) -> None:
-        self.client = boto3.client("secretsmanager")
+        self.client = _secrets_manager_client()
 
     def get_secret(self, secret_arn: str) -> str:
         """Retrieve secret value from AWS Secrets Manager using its ARN."""
@@ -1,16 +1,22 @@
 import csv
 import io
 import logging
+from collections.abc import Buffer
 from typing import Any, Collection, Iterable, Mapping, Optional, cast
 
 import pandas as pd
 from django.db.backends.utils import CursorWrapper
-from psycopg import sql
+from psycopg import Copy, sql
 
 from main.models import DbLockId
 
 logger = logging.getLogger(__name__)
 
+# Bytes of CSV accumulated per COPY write in load_data
+DEFAULT_LOAD_DATA_BUFFER_SIZE = 16 * 1024 * 1024
+# Rows serialized per COPY write in load_df, bounding the CSV held in memory
+DEFAULT_LOAD_DF_CHUNK_SIZE = 50_000
+
 
 def create_temp_table(
     cursor: CursorWrapper, table: str, columns: list[tuple[str, str, str]]
@@ -87,20 +93,22 @@ def create_index(
     cursor.execute(stmt)
 
 
+def _write_copy_buffer(copy: Copy, buffer: io.BytesIO) -> None:
+    """Sends the buffer's contents to COPY and empties it for reuse."""
+    with buffer.getbuffer() as view:
+        copy.write(view)
+
+    buffer.seek(0)
+    buffer.truncate()
+
+
 def load_data(
     cursor: CursorWrapper,
     table_name: str,
     data: Iterable[Mapping[str, object]],
     col_names: Collection[str],
+    buffer_size: int = DEFAULT_LOAD_DATA_BUFFER_SIZE,
 ) -> None:
-    buffer = io.BytesIO()
-    text_io = io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
-    writer = csv.DictWriter(text_io, fieldnames=col_names, extrasaction="ignore")
-
-    writer.writerows(data)
-    text_io.detach()
-    buffer.seek(0)
-
     # TODO: Log rows copied
     stmt = sql.SQL(
         "copy {table} ({columns}) from stdin with (format csv, delimiter ',')"
@@ -108,9 +116,23 @@ def load_data(
         table=sql.Identifier(table_name),
         columns=sql.SQL(",").join([sql.Identifier(col) for col in col_names]),
     )
+
+    buffer = io.BytesIO()
+    text_io = io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    writer = csv.DictWriter(text_io, fieldnames=col_names, extrasaction="ignore")
+
+    # Send the CSV whenever buffer_size bytes have accumulated, so memory use
+    # doesn't grow with the number of rows
     with cursor.copy(stmt) as copy:
-        while chunk := buffer.read(1024):
-            copy.write(chunk)
+        for row in data:
+            writer.writerow(row)
+
+            if buffer.tell() >= buffer_size:
+                _write_copy_buffer(copy, buffer)
+
+        _write_copy_buffer(copy, buffer)
+
+    text_io.detach()
 
 
 def load_df(
@@ -118,21 +140,24 @@ def load_df(
     table_name: str,
     df: pd.DataFrame,
     col_names: list[str],
+    chunk_size: int = DEFAULT_LOAD_DF_CHUNK_SIZE,
 ) -> int:
-    buffer = io.BytesIO()
-
-    df.to_csv(buffer, columns=col_names, index=False)
-    buffer.seek(0)
-
     stmt = sql.SQL(
-        "copy {table} ({columns}) from stdin with (format csv, header, delimiter ',')"
+        "copy {table} ({columns}) from stdin with (format csv, delimiter ',')"
     ).format(
         table=sql.Identifier(table_name),
         columns=sql.SQL(",").join([sql.Identifier(col) for col in col_names]),
     )
 
+    # Serialize chunk_size rows at a time so only one chunk of CSV is held in
+    # memory next to the DataFrame, rather than a CSV image of the whole thing
     with cursor.copy(stmt) as copy:
-        copy.write(buffer.read())
+        for start in range(0, len(df), chunk_size):
+            copy.write(
+                df.iloc[start : start + chunk_size].to_csv(
+                    columns=col_names, index=False, header=False
+                )
+            )
 
     if cursor.rowcount != len(df):
         raise Exception(
@@ -144,6 +169,33 @@ def load_df(
     return cast(int, cursor.rowcount)
 
 
+class _CopyReader(io.RawIOBase):
+    """Readable file object over the data chunks of a COPY TO STDOUT."""
+
+    def __init__(self, chunks: Iterable[Buffer]) -> None:
+        self._chunks = iter(chunks)
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Buffer) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+
+            if chunk is None:
+                return 0
+
+            self._chunk = memoryview(chunk).cast("B")
+
+        out = memoryview(b).cast("B")
+        n = min(len(out), len(self._chunk))
+        out[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+
+        return n
+
+
 def extract_df(
     cursor: CursorWrapper,
     query: sql.Composed | sql.SQL,
@@ -158,16 +210,14 @@ def extract_df(
         query=query,
     )
 
+    # Parse while the server is still sending, instead of collecting the whole
+    # CSV in a buffer first
     with cursor.copy(stmt, query_params) as copy:
-        buffer = io.BytesIO()
-
-        for data in copy:
-            buffer.write(data)
-
-        buffer.seek(0)
-
         return pd.read_csv(
-            buffer, dtype=dtype, na_filter=na_filter, parse_dates=parse_dates
+            io.BufferedReader(_CopyReader(copy)),
+            dtype=dtype,
+            na_filter=na_filter,
+            parse_dates=parse_dates,
         )
 
 
@@ -1,4 +1,10 @@
+import base64
+import json
 import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any, Optional, cast
 
@@ -13,6 +19,8 @@ from main.services.identity.identity_service import IdentityService
 
 LOGGER = logging.getLogger(__name__)
 
+JWKS_CACHE_TTL_SECONDS = 600
+
 
 class InvalidClientIdClaim(Exception):
     """Invalid client_id claim in JWT payload."""
@@ -20,42 +28,98 @@ class InvalidClientIdClaim(Exception):
 
 def extract_token_from_request(request: Request, jwt_header_name: str) -> Optional[str]:
     """Extracts JWT from the Authorization header."""
-    LOGGER.info(f"Extracting JWT from request header {jwt_header_name}")
+    LOGGER.debug("Extracting JWT from request header %s", jwt_header_name)
 
     jwt_header_value = request.headers.get(jwt_header_name, None)
 
     if (
         jwt_header_name == "Authorization"
         and jwt_header_value
-        and jwt_header_value.startswith("Bearer ")
+        # Auth scheme is case-insensitive (RFC 6750)
+        and jwt_header_value[:7].lower() == "bearer "
     ):
-        return jwt_header_value.split(" ")[1]
+        return jwt_header_value[7:].strip() or None
 
     return jwt_header_value
 
 
-@lru_cache(maxsize=32)
-def get_key_for_kid(jwks_url: str, kid: str) -> Any:
+@dataclass
+class _JwksCache:
+    keys: dict[str, Any] = field(default_factory=dict)
+    expires_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get(self, kid: str) -> Any:
+        if time.monotonic() < self.expires_at:
+            return self.keys.get(kid)
+
+        return None
+
+
+@lru_cache(maxsize=8)
+def _get_jwks_cache(jwks_url: str) -> _JwksCache:
+    """Returns the key cache shared by every request for the same JWKS URL."""
+    return _JwksCache()
+
+
+def _fetch_jwks_keys(jwks_url: str) -> dict[str, Any]:
     LOGGER.info(f"Retrieving JWKS from {jwks_url}")
 
     response = requests.get(jwks_url)
     response.raise_for_status()
     jwks = response.json()
-    keys = jwks.get("keys", [])
 
-    for jwk in keys:
-        if jwk.get("kid") == kid and jwk.get("kty") == "RSA":
-            return jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+    return {
+        jwk["kid"]: jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+        for jwk in jwks.get("keys", [])
+        if jwk.get("kid") and jwk.get("kty") == "RSA"
+    }
+
+
+def get_key_for_kid(jwks_url: str, kid: str) -> Any:
+    cache = _get_jwks_cache(jwks_url)
+    key = cache.get(kid)
+
+    if key is None:
+        # Concurrent misses wait on the lock and reuse the first thread's fetch
+        with cache.lock:
+            key = cache.get(kid)
+
+            if key is None:
+                cache.keys = _fetch_jwks_keys(jwks_url)
+                # Jitter expiry so workers don't all refetch at the same moment
+                cache.expires_at = time.monotonic() + JWKS_CACHE_TTL_SECONDS * (
+                    random.uniform(0.9, 1.0)
+                )
+                key = cache.keys.get(kid)
+
+    if key is None:
+        raise ValueError(f"No matching key found for kid: {kid}")
+
+    return key
+
+
+def _get_unverified_kid(token: str) -> Optional[str]:
+    """Reads kid from the JWT header without decoding the payload and signature.
+
+    jwt.decode verifies the full token afterwards, so nothing is trusted here.
+    """
+    header_segment = token.split(".", 1)[0]
+    headers = json.loads(
+        base64.urlsafe_b64decode(header_segment + "=" * (-len(header_segment) % 4))
+    )
+
+    if not isinstance(headers, dict):
+        raise ValueError("Expected JWT header to be object")
 
-    raise ValueError(f"No matching key found for kid: {kid}")
+    return cast(Optional[str], headers.get("kid"))
 
 
 def decode_jwt(jwks_url: str, token: str, audience: Optional[str]) -> Any:
     """Decodes (and verifies) a JWT."""
-    LOGGER.info("Decoding JWT")
+    LOGGER.debug("Decoding JWT")
 
-    headers = jwt.get_unverified_header(token)
-    kid: Optional[str] = headers.get("kid")
+    kid = _get_unverified_kid(token)
 
     if not kid:
         raise ValueError("No 'kid' found in token header")
@@ -74,7 +138,7 @@ def decode_jwt(jwks_url: str, token: str, audience: Optional[str]) -> Any:
 def get_jwt_payload(
     request: Request, jwt_header_name: str, jwks_url: str, audience: Optional[str]
 ) -> dict[str, Any]:
-    LOGGER.info(f"Getting JWT payload. jwks_url={jwks_url}")
+    LOGGER.debug("Getting JWT payload. jwks_url=%s", jwks_url)
 
     token = extract_token_from_request(request, jwt_header_name)
 
@@ -114,10 +178,10 @@ class JwtAuthentication(authentication.BaseAuthentication):
             if payload_client_id and payload_client_id != jwt_config["client_id"]:
                 raise InvalidClientIdClaim("Invalid client_id claim")
 
-            LOGGER.info("Found JWT payload, retrieving user by sub")
+            LOGGER.debug("Found JWT payload, retrieving user by sub")
 
             # NOTE: We assume that the sub claim is a unique user ID
-            user = IdentityService().get_internal_user_by_idp_user_id(payload["sub"])
+            user = identity_service.get_internal_user_by_idp_user_id(payload["sub"])
 
             return (user, None)
         except User.DoesNotExist as err:
@@ -1,4 +1,4 @@
-import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, Type
 
 from rest_framework import permissions
@@ -12,15 +12,11 @@ from main.models import User, UserRole
 if TYPE_CHECKING:
     from rest_framework.views import APIView
 
-LOGGER = logging.getLogger(__name__)
-
 
 class IsAdmin(permissions.BasePermission):
     """Custom permission to only allow admins."""
 
     def has_permission(self, request: Request, view: "APIView") -> bool:
-        LOGGER.info("Checking if request user is an admin")
-
         if isinstance(request.user, User):
             return request.user.role == UserRole.admin
         else:
@@ -31,20 +27,28 @@ class IsMember(permissions.BasePermission):
     """Custom permission to only allow members."""
 
     def has_permission(self, request: Request, view: "APIView") -> bool:
-        LOGGER.info("Checking if request user is a member")
-
         if isinstance(request.user, User):
             return request.user.role == UserRole.member
         else:
             return False
 
 
+@lru_cache(maxsize=None)
+def _get_permission(
+    perm: Type[permissions.BasePermission],
+) -> permissions.BasePermission:
+    """Returns a shared instance of a (stateless) permission class."""
+    return perm()
+
+
 class AnyOf(permissions.BasePermission):
     def __init__(self, *perms: Type[permissions.BasePermission]) -> None:
         self.perms = perms
 
     def has_permission(self, request: Request, view: "APIView") -> bool:
-        return any(perm().has_permission(request, view) for perm in self.perms)
+        return any(
+            _get_permission(perm).has_permission(request, view) for perm in self.perms
+        )
 
 
 class IsMemberOrAdmin(AnyOf):